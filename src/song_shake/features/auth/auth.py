@@ -1,5 +1,6 @@
 import json
 import time
+from functools import lru_cache
 from rich.prompt import Prompt
 from rich import print
 from ytmusicapi import YTMusic
@@ -12,15 +13,45 @@ from song_shake.platform.logging_config import get_logger
 logger = get_logger(__name__)
 
 OAUTH_FILE = "oauth.json"
+
+
+def _pooled_session() -> requests.Session:
+    """Build a keep-alive session with room for concurrent HTTPS requests."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=1)
+def data_api_session() -> requests.Session:
+    """Return a shared keep-alive session for YouTube Data API calls.
+
+    Reusing one connection pool avoids a TCP/TLS handshake per request,
+    which adds up when paginating through large playlists.
+    """
+    return _pooled_session()
+
+
+@lru_cache(maxsize=1)
+def public_ytmusic() -> YTMusic:
+    """Return a shared unauthenticated YTMusic client.
+
+    Song and album adapters are built per enrichment run (and per retry),
+    so sharing one client keeps music.youtube.com connections warm across
+    runs instead of opening a fresh TLS session for each adapter.
+    """
+    return YTMusic(requests_session=_pooled_session())
+
+
 def get_ytmusic() -> YTMusic:
-    if not os.path.exists(OAUTH_FILE):
-        # Fallback to checking if we can init from env but usually we need the file
+    # Open directly instead of stat-then-open (one syscall, no TOCTOU race)
+    try:
+        with open(OAUTH_FILE) as f:
+            auth_data = json.load(f)
+    except FileNotFoundError:
         print(f"[bold red]Auth file {OAUTH_FILE} not found. Please run 'song-shake auth' first.[/bold red]")
-        raise FileNotFoundError("Auth file not found")
-        
-    # Robust init logic from api.py
-    with open(OAUTH_FILE) as f:
-        auth_data = json.load(f)
+        raise FileNotFoundError("Auth file not found") from None
     
     if 'client_id' not in auth_data and os.getenv("GOOGLE_CLIENT_ID"):
             auth_data['client_id'] = os.getenv("GOOGLE_CLIENT_ID")
@@ -41,11 +72,11 @@ def ensure_fresh_access_token() -> str:
 
     Raises ValueError if no valid token can be obtained.
     """
-    if not os.path.exists(OAUTH_FILE):
-        raise ValueError("OAUTH_FILE not found")
-
-    with open(OAUTH_FILE) as f:
-        auth_data = json.load(f)
+    try:
+        with open(OAUTH_FILE) as f:
+            auth_data = json.load(f)
+    except FileNotFoundError:
+        raise ValueError("OAUTH_FILE not found") from None
 
     token = auth_data.get("access_token")
     expires_at = auth_data.get("expires_at")
@@ -109,7 +140,7 @@ def get_data_api_playlists(yt: YTMusic, limit: int = 50, access_token: str | Non
         'maxResults': min(limit, 50)
     }
     
-    res = requests.get(api_url, headers=headers, params=params, timeout=10)
+    res = data_api_session().get(api_url, headers=headers, params=params, timeout=10)
     res.raise_for_status()
     data = res.json()
     
@@ -164,7 +195,7 @@ def get_data_api_tracks(yt: YTMusic, playlist_id: str, limit: int = 500, access_
             'pageToken': page_token
         }
         
-        res = requests.get(api_url, headers=headers, params=params, timeout=10)
+        res = data_api_session().get(api_url, headers=headers, params=params, timeout=10)
         res.raise_for_status()
         data = res.json()
         
@@ -9,6 +9,7 @@ import threading
 
 from tinydb import TinyDB, where
 
+from song_shake.features.songs.storage import OrjsonStorage
 from song_shake.platform.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -21,7 +22,7 @@ _lock = threading.Lock()
 
 def _get_table(db: TinyDB | None = None) -> tuple[TinyDB, any]:
     """Return (db_instance, table). Caller must hold _lock."""
-    _db = db or TinyDB(_DB_PATH)
+    _db = db or TinyDB(_DB_PATH, storage=OrjsonStorage)
     return _db, _db.table(_TABLE_NAME)
 
 
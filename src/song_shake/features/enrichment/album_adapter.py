@@ -1,20 +1,62 @@
 """Production AlbumFetcher adapter wrapping unauthenticated YTMusic."""
 
+import threading
+import time
+
 from ytmusicapi import YTMusic
 
+from song_shake.features.auth.auth import public_ytmusic
 from song_shake.platform.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Process-wide TTL cache for album responses, shared across adapter
+# instances so tracks from the same album in later runs skip the request.
+# Key: browse_id → (expires_at monotonic timestamp, response dict)
+_CACHE_TTL = 86_400  # seconds — album metadata rarely changes within a day
+_NEGATIVE_CACHE_TTL = 300  # seconds — failed lookups retry sooner
+_CACHE_MAX_ENTRIES = 2_048
+_album_cache: dict[str, tuple[float, dict]] = {}
+_cache_lock = threading.Lock()
+
 
 class YTMusicAlbumAdapter:
-    """Fetches album metadata via unauthenticated YTMusic."""
+    """Fetches album metadata via unauthenticated YTMusic.
+
+    Args:
+        yt: YTMusic client to use; defaults to the shared public client.
+        cache_ttl: Seconds to cache successful responses (0 disables).
+        negative_cache_ttl: Seconds to cache failed responses.
+    """
 
-    def __init__(self) -> None:
-        self._yt = YTMusic()
+    def __init__(
+        self,
+        yt: YTMusic | None = None,
+        cache_ttl: float = _CACHE_TTL,
+        negative_cache_ttl: float = _NEGATIVE_CACHE_TTL,
+    ) -> None:
+        self._yt = yt or public_ytmusic()
+        self._cache_ttl = cache_ttl
+        self._negative_cache_ttl = negative_cache_ttl
 
     def get_album(self, browse_id: str) -> dict:
         """Fetch album metadata including year, artists, track count."""
+        with _cache_lock:
+            entry = _album_cache.get(browse_id)
+        if entry is not None and entry[0] > time.monotonic():
+            return dict(entry[1])
+
+        now = time.monotonic()
+        result = self._fetch_album(browse_id)
+        ttl = self._cache_ttl if result else self._negative_cache_ttl
+        if ttl > 0:
+            with _cache_lock:
+                if browse_id not in _album_cache and len(_album_cache) >= _CACHE_MAX_ENTRIES:
+                    _album_cache.pop(next(iter(_album_cache)))  # evict oldest insertion
+                _album_cache[browse_id] = (now + ttl, result)
+        return dict(result)
+
+    def _fetch_album(self, browse_id: str) -> dict:
         try:
             album = self._yt.get_album(browse_id)
             return {
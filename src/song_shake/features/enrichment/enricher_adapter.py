@@ -19,6 +19,8 @@ from song_shake.platform.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+_MODEL = "gemini-3-flash-preview"
+
 _URL_PROMPT_TEMPLATE = """Analyze this YouTube Music track and provide musical metadata.
 
 YouTube URL: https://music.youtube.com/watch?v={video_id}
@@ -63,6 +65,11 @@ class GeminiEnricherAdapter:
             api_key=api_key,
             http_options=types.HttpOptions(timeout=120_000),
         )
+        # Request config is identical for every track — build it once.
+        self._config = types.GenerateContentConfig(
+            response_mime_type="application/json",
+            tools=[types.Tool(google_search=types.GoogleSearch())],
+        )
 
     def enrich_by_url(self, video_id: str, title: str, artist: str) -> dict:
         """Enrich a track via YouTube URL — no audio download needed.
@@ -91,12 +98,9 @@ class GeminiEnricherAdapter:
         )
 
         response = self._client.models.generate_content(
-            model="gemini-3-flash-preview",
+            model=_MODEL,
             contents=[prompt],
-            config=types.GenerateContentConfig(
-                response_mime_type="application/json",
-                tools=[types.Tool(google_search=types.GoogleSearch())],
-            ),
+            config=self._config,
         )
 
         usage = response.usage_metadata
@@ -1,10 +1,14 @@
 import os
 import json
+import threading
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from typing import Any
+from types import MappingProxyType
 from rich.console import Console
 from rich.progress import Progress
 from rich.table import Table
-from dotenv import load_dotenv
 import time
 from song_shake.platform.logging_config import get_logger
 from song_shake.platform.protocols import (
@@ -20,7 +24,7 @@ logger = get_logger(__name__)
 console = Console()
 
 
-def _artist_display_name(artist) -> str:
+def _artist_display_name(artist: dict | str) -> str:
     """Extract display name from an artist entry.
 
     ytmusicapi may return artists as dicts ({"name": "X", "id": "Y"})
@@ -31,7 +35,12 @@ def _artist_display_name(artist) -> str:
     return str(artist)
 
 
-def _normalize_artist(artist) -> dict:
+def _artists_display(artists: Iterable[dict | str]) -> str:
+    """Join artist display names into a single comma-separated string."""
+    return ", ".join(_artist_display_name(a) for a in artists)
+
+
+def _normalize_artist(artist: dict | str) -> dict[str, str | None]:
     """Convert an artist entry to a consistent dict format.
 
     ytmusicapi may return artists as dicts or plain strings.
@@ -53,16 +62,71 @@ PRICE_INPUT_PER_1M = 0.50
 PRICE_OUTPUT_PER_1M = 3.00
 PRICE_SEARCH_PER_QUERY = 0.014
 
+# Read-only metadata for tracks that carry no AI tags (non-music or failed).
+# genres/moods/instruments are omitted: _build_track_data creates fresh
+# empty lists for missing keys, so nothing here is shared between tracks.
+_EMPTY_METADATA = MappingProxyType({"bpm": None, "vocal_type": None})
+
+_WATCH_URL = "https://music.youtube.com/watch?v="
+
+_NO_ALT_REPLACED = "Video replaced and no alternative found"
+_NO_ALT_UNPLAYABLE = "UNPLAYABLE and no alternative found"
+
+# Track status keyed by (is_music, is_error); non-music wins over errors.
+_STATUS_BY_OUTCOME = {
+    (True, False): "success",
+    (True, True): "error",
+    (False, False): "non-music",
+    (False, True): "non-music",
+}
+
+# Number of processed tracks buffered before one save_tracks_batch call.
+SAVE_BATCH_SIZE = 32
+
+# Tracks enriched concurrently by process_playlist / retry_failed_tracks
+# (each track is a few network-bound round-trips).
+ENRICH_MAX_WORKERS = 8
+
+# HTTP status codes from the enricher that mean "slow down".
+_THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+# Attempts per enricher call when it fails with a throttling error, and the
+# first backoff delay in seconds (doubled after every failed attempt).
+ENRICH_ATTEMPTS = 3
+ENRICH_RETRY_BACKOFF = 1.0
+
+# Minimum seconds between status-only progress callbacks ("Processing: …").
+# Reports carrying track_data, and the final report, are never dropped.
+PROGRESS_MIN_INTERVAL = 0.1
+
+
 class TokenTracker:
-    def __init__(self):
-        self.input_tokens = 0
-        self.output_tokens = 0
-        self.search_queries = 0
-        self.successful = 0
-        self.failed = 0
-        self.errors = []
+    """Accumulates token usage, search queries and per-track outcomes.
+
+    The add_* and record_result methods are safe to call from worker
+    threads; each update happens under the tracker's own lock.
+    """
+
+    __slots__ = (
+        "_lock",
+        "input_tokens",
+        "output_tokens",
+        "search_queries",
+        "successful",
+        "failed",
+        "errors",
+    )
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.input_tokens: int = 0
+        self.output_tokens: int = 0
+        self.search_queries: int = 0
+        self.successful: int = 0
+        self.failed: int = 0
+        self.errors: list[str] = []
     
-    def add_usage(self, usage_metadata):
+    def add_usage(self, usage_metadata: Any) -> None:
         if not usage_metadata:
             return
         # usage_metadata is likely an object with prompt_token_count, candidates_token_count
@@ -70,10 +134,11 @@ class TokenTracker:
         p_tokens = getattr(usage_metadata, 'prompt_token_count', 0)
         c_tokens = getattr(usage_metadata, 'candidates_token_count', 0)
         
-        self.input_tokens += p_tokens
-        self.output_tokens += c_tokens
+        with self._lock:
+            self.input_tokens += p_tokens
+            self.output_tokens += c_tokens
 
-    def add_usage_from_dict(self, usage_dict: dict) -> None:
+    def add_usage_from_dict(self, usage_dict: dict[str, int] | None) -> None:
         """Update token and search query counts from a plain dict.
 
         Expected keys: prompt_tokens (int), candidates_tokens (int),
@@ -81,17 +146,42 @@ class TokenTracker:
         """
         if not usage_dict:
             return
-        self.input_tokens += usage_dict.get("prompt_tokens", 0)
-        self.output_tokens += usage_dict.get("candidates_tokens", 0)
-        self.search_queries += usage_dict.get("search_queries", 0)
-
-    def get_cost(self):
+        prompt_tokens = usage_dict.get("prompt_tokens", 0)
+        candidates_tokens = usage_dict.get("candidates_tokens", 0)
+        search_queries = usage_dict.get("search_queries", 0)
+        with self._lock:
+            self.input_tokens += prompt_tokens
+            self.output_tokens += candidates_tokens
+            self.search_queries += search_queries
+
+    def record_result(
+        self, *, failed: bool, usage_dict: dict[str, int] | None = None
+    ) -> None:
+        """Count one finished track as successful or failed and add its usage."""
+        self.add_usage_from_dict(usage_dict)
+        with self._lock:
+            if failed:
+                self.failed += 1
+            else:
+                self.successful += 1
+
+    def merge(self, other: "TokenTracker") -> None:
+        """Add another tracker's counts, e.g. one worker's per-track tracker."""
+        with self._lock:
+            self.input_tokens += other.input_tokens
+            self.output_tokens += other.output_tokens
+            self.search_queries += other.search_queries
+            self.successful += other.successful
+            self.failed += other.failed
+            self.errors.extend(other.errors)
+
+    def get_cost(self) -> float:
         input_cost = (self.input_tokens / 1_000_000) * PRICE_INPUT_PER_1M
         output_cost = (self.output_tokens / 1_000_000) * PRICE_OUTPUT_PER_1M
         search_cost = self.search_queries * PRICE_SEARCH_PER_QUERY
         return input_cost + output_cost + search_cost
 
-    def print_summary(self):
+    def print_summary(self) -> None:
         total_cost = self.get_cost()
         
         table = Table(title="Processing Summary")
@@ -108,26 +198,238 @@ class TokenTracker:
         console.print(table)
 
 
+class _SingleFlight:
+    """Coalesce concurrent calls for the same key into one in-flight call.
+
+    Callers that arrive while a call for ``key`` is running wait for and
+    share its result (or exception) instead of issuing a duplicate request.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._inflight: dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+
+class _AlbumYearCache:
+    """Per-run memo of album years keyed by album browse id.
+
+    Safe to share between worker threads: concurrent misses for the same
+    album are coalesced into a single get_album call.
+    """
+
+    def __init__(self, album_fetcher: AlbumFetcher) -> None:
+        self._album_fetcher = album_fetcher
+        self._years: dict[str, str | None] = {}
+        self._inflight = _SingleFlight()
+
+    def get(self, album_browse_id: str | None) -> str | None:
+        """Return the album's year, fetching it on first use."""
+        if not album_browse_id:
+            return None
+        if album_browse_id in self._years:
+            return self._years[album_browse_id]
+        return self._inflight.do(album_browse_id, self._fetch, album_browse_id)
+
+    def _fetch(self, album_browse_id: str) -> str | None:
+        # A leader that finished just before this call may have filled it
+        if album_browse_id not in self._years:
+            album_meta = self._album_fetcher.get_album(album_browse_id)
+            self._years[album_browse_id] = album_meta.get("year")
+        return self._years[album_browse_id]
+
+
+class _TrackSaveBuffer:
+    """Buffer track saves and write them through save_tracks_batch.
+
+    Use as a context manager: exiting flushes whatever is still pending,
+    including when processing is aborted by an error or cancellation.
+    """
+
+    def __init__(self, storage_port: StoragePort, size: int = SAVE_BATCH_SIZE) -> None:
+        self._storage_port = storage_port
+        self._size = size
+        self._pending: list[dict[str, Any]] = []
+
+    def add(self, track_data: dict[str, Any]) -> None:
+        self._pending.append(track_data)
+        if len(self._pending) >= self._size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        save_batch = getattr(self._storage_port, "save_tracks_batch", None)
+        if save_batch is not None:
+            save_batch(pending)
+        else:
+            # Ports written before save_tracks_batch existed
+            for track_data in pending:
+                self._storage_port.save_track(track_data)
 
+    def __enter__(self) -> "_TrackSaveBuffer":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.flush()
+
+
+class _ProgressThrottle:
+    """Rate-limit progress callbacks using a monotonic clock.
+
+    Safe to share between worker threads. The first call is always allowed.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._last: float | None = None
+
+    def ready(self) -> bool:
+        """Return True (and restart the interval) if a report may go out now."""
+        now = time.monotonic()
+        with self._lock:
+            if self._last is not None and now - self._last < self._interval:
+                return False
+            self._last = now
+            return True
+
+
+def _is_rate_limit_error(exc: BaseException) -> bool:
+    """Whether the enricher answered 429/503 (rate limited or overloaded).
+
+    Decided from exception types and HTTP status codes only — never from the
+    message text, which may contain ids or counts that look like status codes.
+    """
+    # Imported lazily: only reached on the (rare) error path
+    import requests
+    from google.genai import errors as genai_errors
+
+    if isinstance(exc, genai_errors.APIError):
+        return exc.code in _THROTTLE_STATUS_CODES
+    if isinstance(exc, requests.HTTPError):
+        return exc.response is not None and exc.response.status_code in _THROTTLE_STATUS_CODES
+    return False
+
+
+def _is_throttle_error(exc: BaseException) -> bool:
+    """Whether an enricher error is transient: rate limiting, overload or network."""
+    if _is_rate_limit_error(exc):
+        return True
+    import httpx
+    import requests
+
+    return isinstance(exc, (
+        TimeoutError,
+        ConnectionError,
+        requests.Timeout,
+        requests.ConnectionError,
+        httpx.TimeoutException,
+        httpx.NetworkError,
+    ))
+
+
+def _call_with_backoff(
+    fn: Callable[..., Any],
+    *args: Any,
+    cancel_check: Callable[[], None] | None = None,
+) -> Any:
+    """Call fn, retrying throttling errors with exponential backoff.
+
+    Other errors, and the last failed attempt, are raised to the caller.
+    ``cancel_check`` runs before each retry so a cancelled job does not
+    sit out the backoff.
+    """
+    for attempt in range(ENRICH_ATTEMPTS):
+        try:
+            return fn(*args)
+        except Exception as e:
+            if attempt == ENRICH_ATTEMPTS - 1 or not _is_throttle_error(e):
+                raise
+            logger.warning("enrich_call_retrying", attempt=attempt + 1, error=str(e))
+            time.sleep(ENRICH_RETRY_BACKOFF * 2 ** attempt)
+            if cancel_check is not None:
+                cancel_check()
+
+
+class _AdaptiveLimit:
+    """AIMD cap on concurrent enricher calls, shared by worker threads.
+
+    Starts at ``ceiling``. A 429/503 answer (see _is_rate_limit_error)
+    halves the cap; every other finished call, including network errors,
+    raises it by one, back up to ``ceiling``. Calls over the cap wait for a
+    slot.
+    """
+
+    def __init__(self, ceiling: int) -> None:
+        self._ceiling = max(1, ceiling)
+        self.limit = self._ceiling
+        self._active = 0
+        self._cond = threading.Condition()
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+
+        throttled = False
+        try:
+            return fn(*args)
+        except Exception as e:
+            throttled = _is_rate_limit_error(e)
+            raise
+        finally:
+            with self._cond:
+                self._active -= 1
+                if throttled:
+                    self.limit = max(1, self.limit // 2)
+                else:
+                    self.limit = min(self._ceiling, self.limit + 1)
+                self._cond.notify_all()
 
 
 def _build_track_data(
     video_id: str,
     title: str,
-    track: dict,
+    track: dict[str, Any],
     owner: str,
-    metadata: dict,
+    metadata: Mapping[str, Any],
     *,
     is_music: bool = True,
     album_year: str | None = None,
     play_count: str | None = None,
     playable_video_id: str | None = None,
-) -> dict:
+) -> dict[str, Any]:
     """Assemble a track_data dict from raw track info and enrichment metadata.
 
     Pure function — no I/O, no side effects.
     """
-    is_error = bool(metadata.get("error"))
+    error = metadata.get("error")
+    is_error = bool(error)
 
     # Structured artists: [{\"name\": \"...\", \"id\": \"...\"}]
     raw_artists = track.get("artists", [])
@@ -150,12 +452,7 @@ def _build_track_data(
             if not album_year and gemini_album.get("year"):
                 album_year = str(gemini_album["year"])
 
-    if not is_music:
-        status = "non-music"
-    elif is_error:
-        status = "error"
-    else:
-        status = "success"
+    status = _STATUS_BY_OUTCOME[bool(is_music), is_error]
 
     # Use playable videoId for the URL so the link actually works
     url_vid = playable_video_id or video_id
@@ -176,8 +473,8 @@ def _build_track_data(
         "isMusic": is_music,
         "status": status,
         "success": is_music and not is_error,
-        "error_message": metadata.get("error"),
-        "url": f"https://music.youtube.com/watch?v={url_vid}",
+        "error_message": error,
+        "url": _WATCH_URL + url_vid,
         "owner": owner,
     }
 
@@ -192,8 +489,9 @@ def process_playlist(
     owner: str = "local",
     wipe: bool = False,
     api_key: str | None = None,
-    on_progress: callable = None,
-    cancel_check: callable = None,
+    on_progress: Callable[[dict[str, Any]], None] | None = None,
+    cancel_check: Callable[[], None] | None = None,
+    max_workers: int = ENRICH_MAX_WORKERS,
     # --- DI ports (None = construct production adapters) ---
     storage_port: StoragePort | None = None,
     playlist_fetcher: PlaylistFetcher | None = None,
@@ -214,8 +512,11 @@ def process_playlist(
         on_progress: Optional callback receiving a dict with keys:
             current (int), total (int), message (str),
             tokens (int), cost (float), track_data (dict | None).
+            Status-only reports are rate-limited to one per
+            PROGRESS_MIN_INTERVAL; per-track results are always sent.
         cancel_check: Optional callable invoked before each track.
             Should raise an exception (e.g. CancelledError) to abort.
+        max_workers: Number of tracks fetched/enriched concurrently.
         storage_port: StoragePort implementation. None = TinyDB production adapter.
         playlist_fetcher: PlaylistFetcher implementation. None = YTMusic production adapter.
         audio_enricher: AudioEnricher implementation. None = Gemini production adapter.
@@ -248,7 +549,7 @@ def process_playlist(
 
     if audio_enricher is None:
         # Resolve API key for production Gemini adapter
-        load_dotenv()
+        # (.env is loaded once at import by the api/CLI entry points)
         if not api_key:
             api_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
         if not api_key:
@@ -264,30 +565,29 @@ def process_playlist(
             console.print(f"[red]Error initializing Gemini client: {e}[/red]")
             return []
 
-    # Cache album metadata to avoid repeated get_album calls for same album
-    album_cache: dict[str, dict] = {}
+    # Fetch each album at most once per run, even across worker threads
+    album_years = _AlbumYearCache(album_fetcher)
+    # Back off Gemini concurrency when it starts rate-limiting
+    enrich_limit = _AdaptiveLimit(max_workers)
 
-    def _fetch_album_year(album_browse_id: str | None) -> str | None:
-        """Fetch album year from cache or via album_fetcher."""
-        if not album_browse_id:
-            return None
-        if album_browse_id in album_cache:
-            return album_cache[album_browse_id].get("year")
-        album_meta = album_fetcher.get_album(album_browse_id)
-        album_cache[album_browse_id] = album_meta
-        return album_meta.get("year")
+    throttle = _ProgressThrottle(PROGRESS_MIN_INTERVAL)
 
     def _report(current: int, total: int, message: str,
-                tracker: TokenTracker, track_data: dict | None = None):
-        if on_progress is not None:
-            on_progress({
-                "current": current,
-                "total": total,
-                "message": message,
-                "tokens": tracker.input_tokens + tracker.output_tokens,
-                "cost": tracker.get_cost(),
-                "track_data": track_data,
-            })
+                tracker: TokenTracker, track_data: dict | None = None,
+                *, force: bool = False) -> None:
+        if on_progress is None:
+            return
+        # Per-track results (they carry errors) always go out; status ticks are throttled
+        if track_data is None and not force and not throttle.ready():
+            return
+        on_progress({
+            "current": current,
+            "total": total,
+            "message": message,
+            "tokens": tracker.input_tokens + tracker.output_tokens,
+            "cost": tracker.get_cost(),
+            "track_data": track_data,
+        })
 
 
     if wipe:
@@ -306,145 +606,205 @@ def process_playlist(
 
     _report(0, total, "Fetching tracks...", tracker)
 
-    with Progress() as progress:
-        task = progress.add_task("Processing tracks...", total=total)
+    # --- Deduplication: one bulk lookup against the global catalog ---
+    # When wipe=True (Fresh Scan), re-process every track
+    cached_tracks: dict[str, dict] = {}
+    if not wipe:
+        cached_tracks = storage_port.get_tracks_by_ids(
+            [t["videoId"] for t in tracks if t.get("videoId")]
+        )
 
-        for i, track in enumerate(tracks):
-            # Check for cancellation before each track
-            if cancel_check is not None:
-                cancel_check()
+    save_buffer = _TrackSaveBuffer(storage_port)
 
-            video_id = track.get('videoId')
-            title = track.get('title', 'Unknown')
-            artists_display = ", ".join(
-                a['name'] for a in track.get('artists', [])
-            )
+    def _process_one_track(
+        track: dict[str, Any],
+    ) -> tuple[dict[str, Any], str, TokenTracker]:
+        """Fetch metadata for and enrich one uncached track.
 
-            if not video_id:
-                progress.advance(task)
-                continue
-
-            _report(i, total, f"Processing: {title} - {artists_display}", tracker)
-
-            # --- Deduplication: skip if already in global catalog ---
-            # When wipe=True (Fresh Scan), re-process every track
-            if not wipe:
-                existing_track = storage_port.get_track_by_id(video_id)
-                if existing_track:
-                    progress.console.print(
-                        f"[dim]Skipping (cached): {title} - {artists_display}[/dim]"
-                    )
-                    existing_track['owner'] = owner
-                    storage_port.save_track(existing_track)
-                    progress.advance(task)
-                    continue
-
-            # --- Enrich track with per-song ytmusicapi metadata ---
-            song_info = song_fetcher.get_song(video_id)
-            is_music = song_info.get("isMusic", True)
-
-            # Replace track artists/album/thumbnails with richer ytmusicapi data
-            rich_artists = song_info.get("artists", [])
-            if rich_artists:
-                track["artists"] = rich_artists
-                artists_display = ", ".join(
-                    _artist_display_name(a) for a in rich_artists
-                )
-            rich_album = song_info.get("album")
-            if rich_album:
-                track["album"] = rich_album
-            rich_thumbs = song_info.get("thumbnails")
-            if rich_thumbs:
-                track["thumbnails"] = rich_thumbs
-            play_count = song_info.get("playCount")
-
-            # --- Year: prefer song_info, fall back to album_fetcher ---
-            album_year = song_info.get("year")
-            if not album_year:
-                album_browse_id = (
-                    track.get("album", {}).get("id")
-                    if track.get("album")
-                    else None
-                )
-                album_year = _fetch_album_year(album_browse_id)
+        Runs on a worker thread. Returns (track_data, progress message,
+        the track's own usage tracker); saving, reporting and merging usage
+        into the run's tracker stay on the calling thread, in playlist order.
+        Works on its own copy of ``track``, which the calling thread reads
+        concurrently.
+        """
+        track = dict(track)
+        track_usage = TokenTracker()
+        video_id = track['videoId']
+        title = track.get('title', 'Unknown')
+        artists_display = _artists_display(track.get('artists', []))
+
+        # --- Enrich track with per-song ytmusicapi metadata ---
+        song_info = song_fetcher.get_song(video_id)
+        is_music = song_info.get("isMusic", True)
+
+        # Replace track artists/album/thumbnails with richer ytmusicapi data
+        rich_artists = song_info.get("artists", [])
+        if rich_artists:
+            track["artists"] = rich_artists
+            artists_display = _artists_display(rich_artists)
+        rich_album = song_info.get("album")
+        if rich_album:
+            track["album"] = rich_album
+        rich_thumbs = song_info.get("thumbnails")
+        if rich_thumbs:
+            track["thumbnails"] = rich_thumbs
+        play_count = song_info.get("playCount")
+
+        # --- Year: prefer song_info, fall back to album_fetcher ---
+        album_year = song_info.get("year")
+        if not album_year:
+            album_browse_id = (
+                track.get("album", {}).get("id")
+                if track.get("album")
+                else None
+            )
+            album_year = album_years.get(album_browse_id)
 
-            if not is_music:
-                progress.console.print(
-                    f"[yellow]Non-music: {title} - {artists_display}[/yellow]"
-                )
-                nonmusic_metadata: dict = {
-                    "genres": [], "moods": [], "instruments": [],
-                    "bpm": None, "vocal_type": None,
-                }
-                track_data = _build_track_data(
-                    video_id, title, track, owner, nonmusic_metadata,
-                    is_music=False, album_year=album_year,
-                    play_count=play_count,
-                )
-                storage_port.save_track(track_data)
-                results.append(track_data)
-                _report(i, total, f"Non-music: {title}", tracker, track_data)
-                progress.advance(task)
-                continue
+        if not is_music:
+            progress.console.print(
+                f"[yellow]Non-music: {title} - {artists_display}[/yellow]"
+            )
+            track_data = _build_track_data(
+                video_id, title, track, owner, _EMPTY_METADATA,
+                is_music=False, album_year=album_year,
+                play_count=play_count,
+            )
+            return track_data, f"Non-music: {title}", track_usage
 
-            progress.console.print(f"Processing: {title} - {artists_display}")
+        # Don't start a Gemini call for a cancelled job; raised outside the
+        # try below so it is not recorded as a failed track
+        if cancel_check is not None:
+            cancel_check()
 
-            # --- Enrich track ---
-            try:
-                playable_video_id = None
+        progress.console.print(f"Processing: {title} - {artists_display}")
 
-                metadata = audio_enricher.enrich_by_url(
-                    video_id, title, artists_display,
-                )
+        # --- Enrich track ---
+        try:
+            playable_video_id = None
 
-                # Update tracker from enricher usage metadata
-                usage_meta = metadata.pop("usage_metadata", None)
-                tracker.add_usage_from_dict(usage_meta)
+            metadata = _call_with_backoff(
+                enrich_limit.run,
+                audio_enricher.enrich_by_url, video_id, title, artists_display,
+                cancel_check=cancel_check,
+            )
 
-                is_error = bool(metadata.get('error'))
-                if is_error:
-                    tracker.failed += 1
-                else:
-                    tracker.successful += 1
+            # Update tracker from enricher usage metadata
+            usage_meta = metadata.pop("usage_metadata", None)
+            is_error = bool(metadata.get('error'))
+            track_usage.record_result(failed=is_error, usage_dict=usage_meta)
 
-                track_data = _build_track_data(
-                    video_id, title, track, owner, metadata,
-                    is_music=True, album_year=album_year,
-                    play_count=play_count,
-                    playable_video_id=playable_video_id,
-                )
+            track_data = _build_track_data(
+                video_id, title, track, owner, metadata,
+                is_music=True, album_year=album_year,
+                play_count=play_count,
+                playable_video_id=playable_video_id,
+            )
+            return track_data, f"Processed: {title}", track_usage
 
-                storage_port.save_track(track_data)
-                results.append(track_data)
-                _report(i, total, f"Processed: {title}", tracker, track_data)
+        except Exception as e:
+            logger.exception(
+                "track_processing_failed",
+                title=title,
+                video_id=video_id,
+            )
+            console.print(f"[red]Failed to process {title}: {e}[/red]")
+            track_usage.record_result(failed=True)
+            err_metadata = {**_EMPTY_METADATA, "error": str(e)}
+            err_track_data = _build_track_data(
+                video_id, title, track, owner, err_metadata,
+                is_music=True, album_year=album_year,
+                play_count=play_count,
+            )
+            return err_track_data, f"Error: {title}", track_usage
 
-            except Exception as e:
-                logger.exception(
-                    "track_processing_failed",
-                    title=title,
-                    video_id=video_id,
-                )
-                console.print(f"[red]Failed to process {title}: {e}[/red]")
-                tracker.failed += 1
-                err_metadata = {
-                    "genres": [],
-                    "moods": [],
-                    "instruments": [],
-                    "bpm": None,
-                    "error": str(e),
-                }
-                err_track_data = _build_track_data(
-                    video_id, title, track, owner, err_metadata,
-                    is_music=True, album_year=album_year,
-                    play_count=play_count,
-                )
-                storage_port.save_track(err_track_data)
-                results.append(err_track_data)
-                _report(i, total, f"Error: {title}", tracker, err_track_data)
+    pool = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="enrich",
+    )
+    # --- Dispatch: each uncached videoId is an independent, network-bound
+    # unit of work, so run them on a bounded pool. Results are consumed in
+    # playlist order, so saving and progress reporting stay sequential.
+    uncached: dict[str, dict] = {}
+    for t in tracks:
+        video_id = t.get('videoId')
+        if video_id and video_id not in cached_tracks:
+            uncached.setdefault(video_id, t)
+    pending = iter(uncached.items())
+    futures: dict[str, Future] = {}
+
+    def _dispatch() -> None:
+        # Keep only a couple of tracks per worker queued ahead of the
+        # consumer, so a cancellation leaves little started work behind
+        while len(futures) < max_workers * 2:
+            item = next(pending, None)
+            if item is None:
+                return
+            video_id, track = item
+            futures[video_id] = pool.submit(_process_one_track, track)
 
-            progress.advance(task)
+    try:
+        # Leaving the block flushes buffered saves, even on cancellation
+        with save_buffer, Progress() as progress:
+            task = progress.add_task("Processing tracks...", total=total)
 
-    _report(total, total, "Enrichment complete", tracker)
+            i = 0
+            try:
+                for i, track in enumerate(tracks):
+                    # Check for cancellation before each track
+                    if cancel_check is not None:
+                        cancel_check()
+
+                    _dispatch()
+
+                    video_id = track.get('videoId')
+                    if not video_id:
+                        progress.advance(task)
+                        continue
+
+                    title = track.get('title', 'Unknown')
+                    artists_display = _artists_display(track.get('artists', []))
+
+                    _report(i, total, f"Processing: {title} - {artists_display}", tracker)
+
+                    # --- Deduplication: skip if already in global catalog
+                    # (or already processed earlier in this playlist) ---
+                    future = futures.pop(video_id, None)
+                    if future is None:
+                        progress.console.print(
+                            f"[dim]Skipping (cached): {title} - {artists_display}[/dim]"
+                        )
+                        existing_track = cached_tracks[video_id]
+                        existing_track['owner'] = owner
+                        save_buffer.add(existing_track)
+                        progress.advance(task)
+                        continue
+
+                    track_data, message, track_usage = future.result()
+                    tracker.merge(track_usage)
+                    save_buffer.add(track_data)
+                    cached_tracks[video_id] = track_data
+                    results.append(track_data)
+                    _report(i, total, message, tracker, track_data)
+                    progress.advance(task)
+            except BaseException:
+                # Drop tracks that have not started, wait for in-flight ones,
+                # and keep whatever they finished: the tokens are already spent
+                pool.shutdown(cancel_futures=True)
+                drained = False
+                for future in futures.values():
+                    if future.cancelled() or future.exception() is not None:
+                        continue
+                    track_data, _, track_usage = future.result()
+                    tracker.merge(track_usage)
+                    save_buffer.add(track_data)
+                    results.append(track_data)
+                    drained = True
+                if drained:
+                    _report(i, total, "Stopped", tracker, force=True)
+                raise
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+    _report(total, total, "Enrichment complete", tracker, force=True)
     console.print(f"[green]Done! Saved {len(results)} tracks to database.[/green]")
     tracker.print_summary()
 
@@ -470,9 +830,10 @@ def process_playlist(
 def retry_failed_tracks(
     owner: str = "local",
     api_key: str | None = None,
-    on_progress: callable = None,
-    cancel_check: callable = None,
+    on_progress: Callable[[dict[str, Any]], None] | None = None,
+    cancel_check: Callable[[], None] | None = None,
     video_ids: list[str] | None = None,
+    max_workers: int = ENRICH_MAX_WORKERS,
     # --- DI ports (None = construct production adapters) ---
     storage_port: StoragePort | None = None,
     audio_enricher: AudioEnricher | None = None,
@@ -489,9 +850,11 @@ def retry_failed_tracks(
         owner: Owner identifier for track ownership.
         api_key: Google/Gemini API key.
         on_progress: Callback with dict {current, total, message, tokens, cost, track_data}.
+            Called from worker threads, but never concurrently.
         cancel_check: Callable that raises on cancellation.
         video_ids: Optional list of specific videoIds to retry.
             If None, retries ALL failed tracks for the owner.
+        max_workers: Number of tracks retried concurrently.
         storage_port: StoragePort implementation.
         audio_enricher: AudioEnricher implementation.
         song_fetcher: SongFetcher implementation.
@@ -509,14 +872,14 @@ def retry_failed_tracks(
 
     if song_fetcher is None:
         from song_shake.features.enrichment.song_adapter import YTMusicSongAdapter
-        song_fetcher = YTMusicSongAdapter()
+        # Retries re-check playability and title, so skip the song cache
+        song_fetcher = YTMusicSongAdapter(cache_ttl=0, negative_cache_ttl=0)
 
     if album_fetcher is None:
         from song_shake.features.enrichment.album_adapter import YTMusicAlbumAdapter
         album_fetcher = YTMusicAlbumAdapter()
 
     if audio_enricher is None:
-        load_dotenv()
         if not api_key:
             api_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
         if not api_key:
@@ -535,224 +898,233 @@ def retry_failed_tracks(
         target_set = set(video_ids)
         failed_tracks = [t for t in all_failed if t.get("videoId") in target_set]
     else:
-        failed_tracks = all_failed
+        # Catalog entries without a videoId can't be re-fetched or enriched
+        failed_tracks = [t for t in all_failed if t.get("videoId")]
 
     if not failed_tracks:
         console.print("[yellow]No failed tracks to retry.[/yellow]")
         return []
 
-    # Cache album metadata
-    album_cache: dict[str, dict] = {}
+    # Fetch each album at most once per run, even across worker threads
+    album_years = _AlbumYearCache(album_fetcher)
+    # Back off Gemini concurrency when it starts rate-limiting
+    enrich_limit = _AdaptiveLimit(max_workers)
 
-    def _fetch_album_year(album_browse_id: str | None) -> str | None:
-        if not album_browse_id:
-            return None
-        if album_browse_id in album_cache:
-            return album_cache[album_browse_id].get("year")
-        album_meta = album_fetcher.get_album(album_browse_id)
-        album_cache[album_browse_id] = album_meta
-        return album_meta.get("year")
+    throttle = _ProgressThrottle(PROGRESS_MIN_INTERVAL)
 
     def _report(current: int, total: int, message: str,
-                tracker: TokenTracker, track_data: dict | None = None):
-        if on_progress is not None:
-            on_progress({
-                "current": current,
-                "total": total,
-                "message": message,
-                "tokens": tracker.input_tokens + tracker.output_tokens,
-                "cost": tracker.get_cost(),
-                "track_data": track_data,
-            })
+                tracker: TokenTracker, track_data: dict | None = None,
+                *, force: bool = False) -> None:
+        if on_progress is None:
+            return
+        # Per-track results (they carry errors) always go out; status ticks are throttled
+        if track_data is None and not force and not throttle.ready():
+            return
+        on_progress({
+            "current": current,
+            "total": total,
+            "message": message,
+            "tokens": tracker.input_tokens + tracker.output_tokens,
+            "cost": tracker.get_cost(),
+            "track_data": track_data,
+        })
 
-    results: list[dict] = []
     tracker = TokenTracker()
     total = len(failed_tracks)
+    # Workers share the progress counter
+    state_lock = threading.Lock()
+    done = 0
+
+    # Identical (title, artist) alternative searches share one request
+    alt_lookups = _SingleFlight()
 
     _report(0, total, f"Retrying {total} failed track(s)…", tracker)
     console.print(f"Retrying {total} failed track(s)…")
 
-    with Progress() as progress:
-        task = progress.add_task("Retrying failed tracks…", total=total)
-
-        for i, failed in enumerate(failed_tracks):
-            if cancel_check is not None:
-                cancel_check()
-
-            video_id = failed.get("videoId")
-            title = failed.get("title", "Unknown")
-
-            _report(i, total, f"Retrying: {title}", tracker)
+    def _finish(message: str, track_data: dict[str, Any], *, failed: bool,
+                usage_meta: dict | None = None) -> None:
+        """Record one finished track in the shared tracker and report it."""
+        nonlocal done
+        tracker.record_result(failed=failed, usage_dict=usage_meta)
+        with state_lock:
+            done += 1
+            _report(done, total, message, tracker, track_data)
+        progress.advance(task)
+
+    def _retry_one(failed: dict[str, Any]) -> dict[str, Any]:
+        """Re-fetch metadata and re-enrich one failed track."""
+        if cancel_check is not None:
+            cancel_check()
+
+        video_id = failed.get("videoId")
+        title = failed.get("title", "Unknown")
+
+        with state_lock:
+            _report(done, total, f"Retrying: {title}", tracker)
+
+        # --- Re-fetch metadata from ytmusicapi ---
+        song_info = song_fetcher.get_song(video_id)
+        is_music = song_info.get("isMusic", True)
+        playable = song_info.get("playable", True)
+
+        # Detect replaced/gone videos: if ytmusicapi returns a
+        # completely different title, the original video ID was
+        # reassigned to another song on YouTube.
+        fetched_title = song_info.get("title") or ""
+        stored_title = title
+        title_matches = (
+            fetched_title.strip().lower() == stored_title.strip().lower()
+        )
+        video_replaced = not title_matches and bool(fetched_title)
+
+        if video_replaced:
+            playable = False
+
+        if video_replaced:
+            rich_artists = failed.get("artists", [])
+        else:
+            rich_artists = song_info.get("artists") or failed.get("artists", [])
+        artists_display = _artists_display(rich_artists)
+
+        track = {
+            "videoId": video_id,
+            "title": title,
+            "artists": rich_artists,
+            "album": (
+                failed.get("album") if video_replaced
+                else song_info.get("album") or failed.get("album")
+            ),
+            "thumbnails": (
+                failed.get("thumbnails", []) if video_replaced
+                else song_info.get("thumbnails") or failed.get("thumbnails", [])
+            ),
+        }
 
-            # --- Re-fetch metadata from ytmusicapi ---
-            song_info = song_fetcher.get_song(video_id)
-            is_music = song_info.get("isMusic", True)
-            playable = song_info.get("playable", True)
+        play_count = (
+            failed.get("playCount") if video_replaced
+            else song_info.get("playCount") or failed.get("playCount")
+        )
 
-            # Detect replaced/gone videos: if ytmusicapi returns a
-            # completely different title, the original video ID was
-            # reassigned to another song on YouTube.
-            fetched_title = song_info.get("title") or ""
-            stored_title = title
-            title_matches = (
-                fetched_title.strip().lower() == stored_title.strip().lower()
+        album_year = None if video_replaced else song_info.get("year")
+        if not album_year:
+            album_browse_id = (
+                track.get("album", {}).get("id")
+                if track.get("album")
+                else None
             )
-            video_replaced = not title_matches and bool(fetched_title)
+            album_year = album_years.get(album_browse_id)
 
-            if video_replaced:
-                playable = False
-
-            if video_replaced:
-                rich_artists = failed.get("artists", [])
-            else:
-                rich_artists = song_info.get("artists") or failed.get("artists", [])
-            artists_display = ", ".join(
-                _artist_display_name(a) for a in rich_artists
+        if video_replaced:
+            progress.console.print(
+                f"[yellow]REPLACED: '{title}' — original video is now "
+                f"'{fetched_title}'. Searching for correct song…[/yellow]"
             )
-
-            track = {
-                "videoId": video_id,
-                "title": title,
-                "artists": rich_artists,
-                "album": (
-                    failed.get("album") if video_replaced
-                    else song_info.get("album") or failed.get("album")
-                ),
-                "thumbnails": (
-                    failed.get("thumbnails", []) if video_replaced
-                    else song_info.get("thumbnails") or failed.get("thumbnails", [])
-                ),
-            }
-
-            play_count = (
-                failed.get("playCount") if video_replaced
-                else song_info.get("playCount") or failed.get("playCount")
+        else:
+            progress.console.print(
+                f"Retrying: {title} - {artists_display}"
             )
 
-            album_year = None if video_replaced else song_info.get("year")
-            if not album_year:
-                album_browse_id = (
-                    track.get("album", {}).get("id")
-                    if track.get("album")
-                    else None
-                )
-                album_year = _fetch_album_year(album_browse_id)
-
-            if video_replaced:
+        # --- Determine which videoId to enrich ---
+        enrich_video_id = video_id
+        playable_video_id = None
+        if not playable:
+            if not video_replaced:
                 progress.console.print(
-                    f"[yellow]REPLACED: '{title}' — original video is now "
-                    f"'{fetched_title}'. Searching for correct song…[/yellow]"
+                    f"[yellow]UNPLAYABLE: {title} — searching for alternative…[/yellow]"
                 )
-            else:
+            alt_vid = alt_lookups.do(
+                (title, artists_display),
+                song_fetcher.search_playable_alternative,
+                title, artists_display,
+            )
+            if alt_vid:
+                enrich_video_id = alt_vid
+                playable_video_id = alt_vid
                 progress.console.print(
-                    f"Retrying: {title} - {artists_display}"
-                )
-
-            # --- Determine which videoId to enrich ---
-            enrich_video_id = video_id
-            playable_video_id = None
-            if not playable:
-                if not video_replaced:
-                    progress.console.print(
-                        f"[yellow]UNPLAYABLE: {title} — searching for alternative…[/yellow]"
-                    )
-                alt_vid = song_fetcher.search_playable_alternative(
-                    title, artists_display
+                    f"[green]Found alternative: {alt_vid}[/green]"
                 )
-                if alt_vid:
-                    enrich_video_id = alt_vid
-                    playable_video_id = alt_vid
-                    progress.console.print(
-                        f"[green]Found alternative: {alt_vid}[/green]"
-                    )
-                    alt_info = song_fetcher.get_song(alt_vid)
-                    alt_artists = alt_info.get("artists") or rich_artists
-                    alt_album = alt_info.get("album") or track.get("album")
-                    alt_year = alt_info.get("year") or album_year
-                    alt_thumbnails = alt_info.get("thumbnails") or track.get("thumbnails", [])
-                    alt_play_count = alt_info.get("playCount") or play_count
-
-                    track["artists"] = alt_artists
-                    track["album"] = alt_album
-                    track["thumbnails"] = alt_thumbnails
-                    rich_artists = alt_artists
-                    artists_display = ", ".join(
-                        _artist_display_name(a) for a in rich_artists
-                    )
-                    play_count = alt_play_count
-                    if alt_year:
-                        album_year = alt_year
-                else:
-                    reason = (
-                        "Video replaced and no alternative found"
-                        if video_replaced
-                        else "UNPLAYABLE and no alternative found"
-                    )
-                    progress.console.print(
-                        f"[red]No playable alternative found for {title}[/red]"
-                    )
-                    tracker.failed += 1
-                    err_metadata = {
-                        "genres": [], "moods": [], "instruments": [],
-                        "bpm": None,
-                        "error": reason,
-                    }
-                    err_track_data = _build_track_data(
-                        video_id, title, track, owner, err_metadata,
-                        is_music=is_music, album_year=album_year,
-                        play_count=play_count,
-                    )
-                    storage_port.save_track(err_track_data)
-                    results.append(err_track_data)
-                    _report(i, total, f"Failed: {title}", tracker, err_track_data)
-                    progress.advance(task)
-                    continue
-
-            # --- Enrich track ---
-            try:
-                metadata = audio_enricher.enrich_by_url(
-                    enrich_video_id, title, artists_display,
+                alt_info = song_fetcher.get_song(alt_vid)
+                alt_artists = alt_info.get("artists") or rich_artists
+                alt_album = alt_info.get("album") or track.get("album")
+                alt_year = alt_info.get("year") or album_year
+                alt_thumbnails = alt_info.get("thumbnails") or track.get("thumbnails", [])
+                alt_play_count = alt_info.get("playCount") or play_count
+
+                track["artists"] = alt_artists
+                track["album"] = alt_album
+                track["thumbnails"] = alt_thumbnails
+                rich_artists = alt_artists
+                artists_display = _artists_display(rich_artists)
+                play_count = alt_play_count
+                if alt_year:
+                    album_year = alt_year
+            else:
+                reason = (
+                    _NO_ALT_REPLACED if video_replaced else _NO_ALT_UNPLAYABLE
                 )
-
-                usage_meta = metadata.pop("usage_metadata", None)
-                tracker.add_usage_from_dict(usage_meta)
-
-                is_error = bool(metadata.get("error"))
-                if is_error:
-                    tracker.failed += 1
-                else:
-                    tracker.successful += 1
-
-                track_data = _build_track_data(
-                    video_id, title, track, owner, metadata,
-                    is_music=is_music, album_year=album_year,
-                    play_count=play_count,
-                    playable_video_id=playable_video_id,
+                progress.console.print(
+                    f"[red]No playable alternative found for {title}[/red]"
                 )
-
-                storage_port.save_track(track_data)
-                results.append(track_data)
-                _report(i, total, f"Retried: {title}", tracker, track_data)
-
-            except Exception as e:
-                console.print(f"[red]Retry failed for {title}: {e}[/red]")
-                tracker.failed += 1
-                err_metadata = {
-                    "genres": [], "moods": [], "instruments": [],
-                    "bpm": None, "error": str(e),
-                }
+                err_metadata = {**_EMPTY_METADATA, "error": reason}
                 err_track_data = _build_track_data(
                     video_id, title, track, owner, err_metadata,
                     is_music=is_music, album_year=album_year,
                     play_count=play_count,
                 )
                 storage_port.save_track(err_track_data)
-                results.append(err_track_data)
-                _report(i, total, f"Error: {title}", tracker, err_track_data)
+                _finish(f"Failed: {title}", err_track_data, failed=True)
+                return err_track_data
 
-            progress.advance(task)
+        # --- Enrich track ---
+        try:
+            metadata = _call_with_backoff(
+                enrich_limit.run,
+                audio_enricher.enrich_by_url,
+                enrich_video_id, title, artists_display,
+            )
+
+            usage_meta = metadata.pop("usage_metadata", None)
+            is_error = bool(metadata.get("error"))
+
+            track_data = _build_track_data(
+                video_id, title, track, owner, metadata,
+                is_music=is_music, album_year=album_year,
+                play_count=play_count,
+                playable_video_id=playable_video_id,
+            )
+
+            storage_port.save_track(track_data)
+            _finish(f"Retried: {title}", track_data, failed=is_error,
+                    usage_meta=usage_meta)
+            return track_data
+
+        except Exception as e:
+            console.print(f"[red]Retry failed for {title}: {e}[/red]")
+            err_metadata = {**_EMPTY_METADATA, "error": str(e)}
+            err_track_data = _build_track_data(
+                video_id, title, track, owner, err_metadata,
+                is_music=is_music, album_year=album_year,
+                play_count=play_count,
+            )
+            storage_port.save_track(err_track_data)
+            _finish(f"Error: {title}", err_track_data, failed=True)
+            return err_track_data
+
+    # Tracks are independent network-bound round-trips, so retry them
+    # concurrently; results keep the order of failed_tracks.
+    with Progress() as progress, ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="retry",
+    ) as pool:
+        task = progress.add_task("Retrying failed tracks…", total=total)
+        futures = [pool.submit(_retry_one, failed) for failed in failed_tracks]
+        try:
+            results = [future.result() for future in futures]
+        except BaseException:
+            # Cancelled (or crashed): drop tracks that have not started yet
+            pool.shutdown(cancel_futures=True)
+            raise
 
-    _report(total, total, "Retry complete", tracker)
+    _report(total, total, "Retry complete", tracker, force=True)
     console.print(f"[green]Retry done! Processed {len(results)} tracks.[/green]")
     tracker.print_summary()
     return results
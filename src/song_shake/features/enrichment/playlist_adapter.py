@@ -91,8 +91,8 @@ class YTMusicPlaylistAdapter:
         # Fallback: Data API snippet for playlist title
         if self._access_token:
             try:
-                import requests
-                res = requests.get(
+                from song_shake.features.auth import auth
+                res = auth.data_api_session().get(
                     "https://www.googleapis.com/youtube/v3/playlists",
                     headers={"Authorization": f"Bearer {self._access_token}"},
                     params={"part": "snippet", "id": playlist_id},
@@ -1,10 +1,12 @@
 """Enrichment routes for Song Shake API."""
 
 import asyncio
-import json
 import os
+import threading
+from collections import OrderedDict, deque
 from typing import Any, Dict, Optional
 
+import orjson
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from fastapi.responses import StreamingResponse
@@ -21,9 +23,104 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/enrichment", tags=["enrichment"])
 
+# Number of most recently processed tracks kept per task as a live preview.
+# Every track is persisted via save_track, so older entries aren't needed.
+RECENT_RESULTS_PREVIEW = 32
+
+# Maximum number of tasks kept in memory. Once exceeded, the oldest
+# finished tasks are evicted; /status falls back to persisted storage.
+MAX_IN_MEMORY_TASKS = 128
+
+# Task statuses that may be evicted — running tasks are still written to.
+_FINISHED_TASK_STATUSES = frozenset({"completed", "error"})
+
+
+class _TaskStore(OrderedDict):
+    """Size-capped, lock-guarded task map that evicts only finished tasks.
+
+    Request threads and background workers share it, so every access
+    takes the lock; iteration, keys(), values() and items() return
+    snapshot lists. The lock is reentrant because OrderedDict's pop and
+    setdefault call back into the item methods on subclasses. Tasks are
+    kept in creation order and never reordered on read; a task that is
+    pending or running is never evicted, even if that leaves the map
+    temporarily above ``maxsize``.
+    """
+
+    def __init__(self, maxsize: int = MAX_IN_MEMORY_TASKS):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.RLock()
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(super().__iter__()))
+
+    def __len__(self):
+        with self._lock:
+            return super().__len__()
+
+    def keys(self):
+        with self._lock:
+            return list(super().keys())
+
+    def values(self):
+        with self._lock:
+            return list(super().values())
+
+    def items(self):
+        with self._lock:
+            return list(super().items())
+
+    def pop(self, key, *default):
+        with self._lock:
+            return super().pop(key, *default)
+
+    def popitem(self, last=True):
+        with self._lock:
+            return super().popitem(last)
+
+    def setdefault(self, key, default=None):
+        with self._lock:
+            return super().setdefault(key, default)
+
+    def clear(self):
+        with self._lock:
+            super().clear()
+
+    def __getitem__(self, key):
+        with self._lock:
+            return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        with self._lock:
+            return super().get(key, default)
+
+    def __contains__(self, key):
+        with self._lock:
+            return super().__contains__(key)
+
+    def __delitem__(self, key):
+        with self._lock:
+            super().__delitem__(key)
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            excess = len(self) - self.maxsize
+            if excess > 0:
+                finished = [
+                    task_id
+                    for task_id, task in super().items()
+                    if task.get("status") in _FINISHED_TASK_STATUSES
+                ]
+                for task_id in finished[:excess]:
+                    super().__delitem__(task_id)
+
+
 # In-memory state for real-time SSE streaming (fast reads during progress).
 # Final state is persisted to storage so it survives restarts.
-enrichment_tasks: Dict[str, Dict[str, Any]] = {}
+enrichment_tasks: Dict[str, Dict[str, Any]] = _TaskStore()
 
 # Module-level storage reference, set during app startup via init_storage().
 _storage: StoragePort | None = None
@@ -48,8 +145,9 @@ def _get_storage() -> StoragePort:
 
 def _persist_task(task_id: str) -> None:
     """Persist the current in-memory task state to storage."""
-    if task_id in enrichment_tasks:
-        state = {k: v for k, v in enrichment_tasks[task_id].items() if k != "results"}
+    task = enrichment_tasks.get(task_id)
+    if task is not None:
+        state = {k: v for k, v in task.items() if k != "results"}
         _get_storage().save_task_state(task_id, state)
 
 
@@ -70,7 +168,7 @@ def process_enrichment(
     playlist_fetcher=None,
 ):
     """Background task that delegates to the shared enrichment logic."""
-    results: list[dict] = []
+    recent_results: deque[dict] = deque(maxlen=RECENT_RESULTS_PREVIEW)
 
     def _on_progress(progress: dict):
         enrichment_tasks[task_id]["status"] = "running"
@@ -80,8 +178,8 @@ def process_enrichment(
         enrichment_tasks[task_id]["tokens"] = progress.get("tokens", 0)
         enrichment_tasks[task_id]["cost"] = progress.get("cost", 0)
         if progress.get("track_data"):
-            results.append(progress["track_data"])
-            enrichment_tasks[task_id]["results"] = results
+            recent_results.append(progress["track_data"])
+            enrichment_tasks[task_id]["results"] = recent_results
 
     try:
         logger.info(
@@ -106,6 +204,8 @@ def process_enrichment(
 
         enrichment_tasks[task_id]["status"] = "completed"
         enrichment_tasks[task_id]["message"] = "Enrichment complete"
+        # Tracks are already persisted per-track; don't pin them in RAM.
+        enrichment_tasks[task_id].pop("results", None)
 
     except Exception as e:
         logger.error("enrichment_failed", task_id=task_id, error=str(e))
@@ -150,7 +250,7 @@ def start_enrichment(request: EnrichmentRequest, background_tasks: BackgroundTas
         "total": 0,
         "current": 0,
         "message": "Initializing...",
-        "results": [],
+        "results": deque(maxlen=RECENT_RESULTS_PREVIEW),
     }
     _persist_task(task_id)
 
@@ -167,8 +267,14 @@ def get_enrichment_status(
     storage: StoragePort = Depends(get_songs_storage),
 ):
     # Check in-memory first (active tasks), then fall back to persistent storage
-    if task_id in enrichment_tasks:
-        return enrichment_tasks[task_id]
+    task = enrichment_tasks.get(task_id)
+    if task is not None:
+        # Snapshot: the worker keeps appending to the results deque, which
+        # must not change while the response is being encoded.
+        snapshot = dict(task)
+        if "results" in snapshot:
+            snapshot["results"] = list(snapshot["results"])
+        return snapshot
 
     persisted = storage.get_task_state(task_id)
     if persisted:
@@ -183,14 +289,14 @@ async def stream_enrichment_status(task_id: str):
         raise HTTPException(status_code=404, detail="Task not found")
 
     async def event_generator():
+        last_frame = b""
         while True:
-            if task_id not in enrichment_tasks:
-                yield f"event: error\ndata: {json.dumps({'error': 'Task lost'})}\n\n"
+            task = enrichment_tasks.get(task_id)
+            if task is None:
+                yield b'event: error\ndata: {"error": "Task lost"}\n\n'
                 break
 
-            task = enrichment_tasks[task_id]
-
-            data = json.dumps(
+            frame = b"data: " + orjson.dumps(
                 {
                     "status": task["status"],
                     "total": task["total"],
@@ -199,9 +305,12 @@ async def stream_enrichment_status(task_id: str):
                     "tokens": task.get("tokens", 0),
                     "cost": task.get("cost", 0),
                 }
-            )
+            ) + b"\n\n"
 
-            yield f"data: {data}\n\n"
+            # Only send if changed
+            if frame != last_frame:
+                yield frame
+                last_frame = frame
 
             if task["status"] in ["completed", "error"]:
                 break
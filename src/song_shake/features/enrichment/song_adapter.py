@@ -4,35 +4,44 @@ Uses ``get_watch_playlist(videoId)`` for rich per-song metadata (artists,
 album, year) and ``get_song(videoId)`` for play count / music detection.
 """
 
+import logging
+import sys
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
 from ytmusicapi import YTMusic
 
+from song_shake.features.auth.auth import public_ytmusic
+from song_shake.features.enrichment.song_parse import (
+    parse_song_details,
+    parse_watch_track,
+)
 from song_shake.platform.logging_config import get_logger
 
 logger = get_logger(__name__)
-
-# Music video type values that indicate recognized music tracks.
-MUSIC_VIDEO_TYPES = frozenset({
-    "MUSIC_VIDEO_TYPE_ATV",   # Audio Track Video (album track)
-    "MUSIC_VIDEO_TYPE_OMV",   # Official Music Video
-    "MUSIC_VIDEO_TYPE_UGC",   # User Generated Content (covers, remixes)
-    "MUSIC_VIDEO_TYPE_OFFICIAL_SOURCE_MUSIC",
-})
-
-
-def format_play_count(count: int | None) -> str | None:
-    """Convert raw play count to human-readable string (e.g. 3.5M, 123K)."""
-    if count is None:
-        return None
-    if count >= 1_000_000_000:
-        value = count / 1_000_000_000
-        return f"{value:.1f}B".replace(".0B", "B") if value < 100 else f"{int(value)}B"
-    if count >= 1_000_000:
-        value = count / 1_000_000
-        return f"{value:.1f}M".replace(".0M", "M") if value < 100 else f"{int(value)}M"
-    if count >= 1_000:
-        value = count / 1_000
-        return f"{value:.1f}K".replace(".0K", "K") if value < 100 else f"{int(value)}K"
-    return str(count)
+# stdlib logger behind ``logger`` — isEnabledFor exists on every supported
+# Python/structlog version, whether or not configure_logging() has run.
+_stdlib_logger = logging.getLogger(__name__)
+
+# Process-wide TTL caches for per-video YTMusic responses, shared across
+# adapter instances (one is built per enrichment run).
+# Key: video_id → (expires_at monotonic timestamp, response dict)
+_CACHE_TTL = 86_400  # seconds — song metadata rarely changes within a day
+_NEGATIVE_CACHE_TTL = 300  # seconds — empty/failed lookups retry sooner
+_CACHE_MAX_ENTRIES = 10_000
+_watch_cache: dict[str, tuple[float, dict]] = {}
+_song_cache: dict[str, tuple[float, dict]] = {}
+_cache_lock = threading.Lock()
+
+# Runs get_watch_playlist concurrently with get_song (see get_song).
+# Shared by all adapter instances so short-lived adapters don't each
+# leave an idle pool behind; threads are only started on demand.
+_WATCH_POOL_WORKERS = 8  # one per concurrent enrichment worker
+_watch_pool = ThreadPoolExecutor(
+    max_workers=_WATCH_POOL_WORKERS, thread_name_prefix="ytmusic-watch",
+)
 
 
 class YTMusicSongAdapter:
@@ -40,10 +49,29 @@ class YTMusicSongAdapter:
 
     Combines get_watch_playlist (for artists/album/year) with
     get_song (for play count and music type detection).
+
+    Args:
+        yt: YTMusic client to use; defaults to the shared public client.
+        cache_ttl: Seconds to cache complete responses. 0 disables the
+            cache for this adapter: every lookup hits YTMusic and replaces
+            whatever other adapters had cached for the video.
+        negative_cache_ttl: Seconds to cache empty/failed responses.
+        skip_watch_playlist_if_non_music: Don't wait for (or, when song
+            details are cached, don't request) the watch playlist once
+            get_song has classified the video as non-music.
     """
 
-    def __init__(self) -> None:
-        self._yt = YTMusic()
+    def __init__(
+        self,
+        yt: YTMusic | None = None,
+        cache_ttl: float = _CACHE_TTL,
+        negative_cache_ttl: float = _NEGATIVE_CACHE_TTL,
+        skip_watch_playlist_if_non_music: bool = True,
+    ) -> None:
+        self._yt = yt or public_ytmusic()
+        self._cache_ttl = cache_ttl
+        self._negative_cache_ttl = negative_cache_ttl
+        self._skip_watch_if_non_music = skip_watch_playlist_if_non_music
 
     def get_song(self, video_id: str) -> dict:
         """Fetch song details combining watch playlist and song endpoint.
@@ -58,76 +86,141 @@ class YTMusicSongAdapter:
             - channelId: str
             - playable: bool
         """
-        # 1. Play count + music detection + playability from get_song
-        song_data = self._fetch_song_details(video_id)
+        # 1. Play count + music detection + playability from get_song.
+        #    On a cache miss the two endpoints are independent round-trips,
+        #    so start the watch playlist request in the background meanwhile.
+        watch_future = None
+        song_data = self._cache_peek(_song_cache, video_id)
+        if song_data is None:
+            watch_future = _watch_pool.submit(self._lookup_watch, video_id)
+            song_data = self._lookup(
+                _song_cache, video_id,
+                self._fetch_song_details, lambda r: "title" in r,
+            )
+        title = song_data.get("title")
         playable = song_data.get("playable", True)
 
         # 2. Rich metadata from watch playlist (artists, album, year, THUMBNAILS)
-        #    Skip if video is UNPLAYABLE — watch playlist returns wrong
-        #    cross-referenced metadata for unplayable videos.
-        if playable:
-            watch_data = self._fetch_watch_playlist(video_id)
+        #    Discard if video is UNPLAYABLE — watch playlist returns wrong
+        #    cross-referenced metadata for unplayable videos.  Known
+        #    non-music videos are rejected downstream, so don't wait for it.
+        non_music = self._skip_watch_if_non_music and song_data.get("isMusic") is False
+        if playable and not non_music:
+            watch_data = (
+                watch_future.result() if watch_future is not None
+                else self._lookup_watch(video_id)
+            )
         else:
+            if watch_future is not None:
+                watch_future.cancel()
             watch_data = {}
-            logger.info(
-                "skipping_watch_playlist_for_unplayable",
-                video_id=video_id,
-            )
+            if not playable:
+                logger.info(
+                    "skipping_watch_playlist_for_unplayable",
+                    video_id=video_id,
+                )
 
         # Merge: watch playlist provides artists/album/year/thumbnails,
         # get_song provides viewCount and musicVideoType
-        artists = watch_data.get("artists") or song_data.get("artists") or []
+        watch_get = watch_data.get
+        song_get = song_data.get
+        artists = watch_get("artists") or song_get("artists") or []
         # Normalize artists: ytmusicapi may return strings or dicts
         artists = [
             a if isinstance(a, dict) else {"name": str(a), "id": None}
             for a in artists
         ]
-        album = watch_data.get("album") or song_data.get("album")
-        year = watch_data.get("year") or song_data.get("year")
+        album = watch_get("album") or song_get("album")
+        year = watch_get("year") or song_get("year")
         # Merge isMusic: watch_playlist's videoType detection is more
         # reliable than get_song's musicVideoType (which can be None for
         # legitimate music tracks, especially unauthenticated).  Use
         # watch_data when song_data is ambiguous (None).
-        song_is_music = song_data.get("isMusic")
-        watch_is_music = watch_data.get("isMusic")
+        song_is_music = song_get("isMusic")
+        watch_is_music = watch_get("isMusic")
         if song_is_music is not None:
             is_music = song_is_music
         elif watch_is_music is not None:
             is_music = watch_is_music
         else:
             is_music = True  # Default: most playlist tracks are music
-        play_count = song_data.get("playCount")
 
         # Prefer watch_playlist thumbnails (square album art from
         # lh3.googleusercontent.com) over get_song thumbnails (which
         # are 16:9 video frames from i.ytimg.com for OMVs).
-        thumbnails = watch_data.get("thumbnails") or song_data.get("thumbnails") or []
+        thumbnails = watch_get("thumbnails") or song_get("thumbnails") or []
 
         channel_id = (
             (artists[0]["id"] if artists and artists[0].get("id") else "")
-            or song_data.get("channelId", "")
+            or song_get("channelId", "")
         )
 
-        if not album:
+        if not album and _stdlib_logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "no_album_for_song",
                 video_id=video_id,
-                title=song_data.get("title"),
-                watch_data_keys=list(watch_data.keys()) if watch_data else [],
+                title=title,
+                watch_data_keys=list(watch_data),
             )
 
         return {
-            "title": song_data.get("title"),
+            "title": title,
             "isMusic": is_music,
             "artists": artists,
             "album": album,
-            "year": str(year) if year else None,
-            "playCount": play_count,
+            "year": sys.intern(str(year)) if year else None,
+            "playCount": song_get("playCount"),
             "thumbnails": thumbnails,
             "channelId": channel_id,
             "playable": playable,
         }
 
+    def _cache_peek(
+        self, cache: dict[str, tuple[float, dict]], video_id: str
+    ) -> dict | None:
+        """Return a copy of the unexpired cached response, or None."""
+        if self._cache_ttl <= 0:
+            return None
+        with _cache_lock:
+            entry = cache.get(video_id)
+        if entry is not None and entry[0] > time.monotonic():
+            return dict(entry[1])
+        return None
+
+    def _lookup_watch(self, video_id: str) -> dict:
+        return self._lookup(
+            _watch_cache, video_id, self._fetch_watch_playlist, bool,
+        )
+
+    def _lookup(
+        self,
+        cache: dict[str, tuple[float, dict]],
+        video_id: str,
+        fetch: Callable[[str], dict],
+        is_complete: Callable[[dict], bool],
+    ) -> dict:
+        """Return a cached response for video_id, or fetch and cache it.
+
+        Complete responses are kept for ``cache_ttl``; empty or failed ones
+        only for ``negative_cache_ttl`` so transient errors can recover.
+        """
+        cached = self._cache_peek(cache, video_id)
+        if cached is not None:
+            return cached
+
+        now = time.monotonic()
+        result = fetch(video_id)
+        ttl = self._cache_ttl if is_complete(result) else self._negative_cache_ttl
+        with _cache_lock:
+            if ttl <= 0:
+                # Don't leave an older answer behind for other adapters
+                cache.pop(video_id, None)
+            else:
+                if video_id not in cache and len(cache) >= _CACHE_MAX_ENTRIES:
+                    cache.pop(next(iter(cache)))  # evict oldest insertion
+                cache[video_id] = (now + ttl, result)
+        return dict(result)
+
     def _fetch_watch_playlist(self, video_id: str) -> dict:
         """Fetch rich metadata from get_watch_playlist.
 
@@ -143,41 +236,7 @@ class YTMusicSongAdapter:
                 )
                 return {}
 
-            track = result["tracks"][0]
-            video_type = track.get("videoType")
-
-            artists = [
-                (
-                    {"name": a.get("name", "Unknown"), "id": a.get("id")}
-                    if isinstance(a, dict)
-                    else {"name": str(a), "id": None}
-                )
-                for a in track.get("artists", [])
-            ]
-
-            raw_album = track.get("album")
-            album = (
-                {"name": raw_album["name"], "id": raw_album.get("id")}
-                if raw_album and raw_album.get("name")
-                else None
-            )
-
-            # Extract square album art thumbnails from watch playlist
-            raw_thumbs = track.get("thumbnail", [])
-            if isinstance(raw_thumbs, dict):
-                raw_thumbs = raw_thumbs.get("thumbnails", [])
-            thumbnails = [
-                {"url": t["url"], "width": t.get("width"), "height": t.get("height")}
-                for t in raw_thumbs if t.get("url")
-            ]
-
-            return {
-                "isMusic": video_type in MUSIC_VIDEO_TYPES if video_type else None,
-                "artists": artists,
-                "album": album,
-                "year": track.get("year"),
-                "thumbnails": thumbnails,
-            }
+            return parse_watch_track(result["tracks"][0])
         except Exception as e:
             logger.warning("watch_playlist_failed", video_id=video_id, error=str(e))
             return {}
@@ -186,36 +245,7 @@ class YTMusicSongAdapter:
         """Fetch play count, music type detection, and playability from get_song."""
         try:
             result = self._yt.get_song(video_id)
-            vd = result.get("videoDetails", {})
-            mvt = vd.get("musicVideoType")
-
-            raw_count = vd.get("viewCount")
-            play_count = format_play_count(int(raw_count)) if raw_count else None
-
-            author = vd.get("author", "").removesuffix(" - Topic").strip()
-
-            # Check playability status
-            ps = result.get("playabilityStatus", {})
-            playable = ps.get("status") != "UNPLAYABLE"
-
-            # Extract square album art thumbnails
-            raw_thumbs = vd.get("thumbnail", {}).get("thumbnails", [])
-            thumbnails = [
-                {"url": t["url"], "width": t.get("width"), "height": t.get("height")}
-                for t in raw_thumbs if t.get("url")
-            ]
-
-            return {
-                "title": vd.get("title"),
-                "isMusic": mvt in MUSIC_VIDEO_TYPES if mvt else None,
-                "artists": [{"name": author, "id": vd.get("channelId", "")}] if author else [],
-                "album": None,
-                "year": None,
-                "playCount": play_count,
-                "thumbnails": thumbnails,
-                "channelId": vd.get("channelId", ""),
-                "playable": playable,
-            }
+            return parse_song_details(result)
         except Exception as e:
             logger.warning("get_song_failed", video_id=video_id, error=str(e))
             return {
@@ -0,0 +1,141 @@
+"""Pure parsing of YTMusic song responses into SongFetcher dicts.
+
+No network access or logging — every function maps already-fetched
+response dicts to plain data, so this module is a self-contained unit
+that can be profiled (or AOT-compiled with mypyc) independently of the
+adapter in ``song_adapter``.
+"""
+
+import sys
+from typing import Any
+
+# Music video type values that indicate recognized music tracks.
+MUSIC_VIDEO_TYPES = frozenset({
+    "MUSIC_VIDEO_TYPE_ATV",   # Audio Track Video (album track)
+    "MUSIC_VIDEO_TYPE_OMV",   # Official Music Video
+    "MUSIC_VIDEO_TYPE_UGC",   # User Generated Content (covers, remixes)
+    "MUSIC_VIDEO_TYPE_OFFICIAL_SOURCE_MUSIC",
+})
+
+# isMusic by video type in one lookup: True for music types, None when the
+# type is missing/empty (ambiguous), and False (the .get default) otherwise.
+_IS_MUSIC_BY_TYPE: dict[str | None, bool | None] = {
+    **dict.fromkeys(MUSIC_VIDEO_TYPES, True),
+    None: None,
+    "": None,
+}
+
+# (threshold, suffix) pairs for format_play_count, largest first.
+_SCALES = ((1_000_000_000, "B"), (1_000_000, "M"), (1_000, "K"))
+# Pre-rendered strings for sub-thousand counts.
+_SMALL_COUNTS = tuple(str(n) for n in range(1_000))
+
+
+def format_play_count(count: int | None) -> str | None:
+    """Convert raw play count to human-readable string (e.g. 3.5M, 123K)."""
+    if count is None:
+        return None
+    if count < 1_000:
+        return _SMALL_COUNTS[count] if count >= 0 else str(count)
+    for scale, suffix in _SCALES:
+        if count >= scale:
+            break
+    value = count / scale
+    if value >= 100:
+        return f"{int(value)}{suffix}"
+    # Round first so whole values print without a trailing ".0"
+    value = round(value, 1)
+    if value == int(value):
+        return f"{int(value)}{suffix}"
+    return f"{value:.1f}{suffix}"
+
+
+def _intern(value: Any) -> Any:
+    """Intern low-cardinality strings (artist/album names, years).
+
+    The same artist or album recurs across many tracks of a playlist, so
+    sharing one str object per value keeps the working set small.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def parse_thumbnails(
+    raw_thumbs: list[dict[str, Any]] | dict[str, Any],
+) -> list[dict[str, Any]]:
+    """Normalize thumbnail entries to ``{url, width, height}``, dropping url-less ones.
+
+    Accepts either a bare list or a ``{"thumbnails": [...]}`` wrapper.
+    """
+    if isinstance(raw_thumbs, dict):
+        raw_thumbs = raw_thumbs.get("thumbnails", [])
+    return [
+        {"url": url, "width": t.get("width"), "height": t.get("height")}
+        for t in raw_thumbs if (url := t.get("url"))
+    ]
+
+
+def parse_watch_track(track: dict[str, Any]) -> dict[str, Any]:
+    """Parse the first track of a get_watch_playlist response.
+
+    Returns artists, album, year, thumbnails (square album art),
+    and isMusic detection.
+    """
+    video_type = track.get("videoType")
+
+    artists = [
+        (
+            {"name": _intern(a.get("name", "Unknown")), "id": _intern(a.get("id"))}
+            if isinstance(a, dict)
+            else {"name": sys.intern(str(a)), "id": None}
+        )
+        for a in track.get("artists", [])
+    ]
+
+    raw_album = track.get("album")
+    album = (
+        {"name": _intern(raw_album["name"]), "id": raw_album.get("id")}
+        if raw_album and raw_album.get("name")
+        else None
+    )
+
+
+    return {
+        "isMusic": _IS_MUSIC_BY_TYPE.get(video_type, False),
+        "artists": artists,
+        "album": album,
+        "year": _intern(track.get("year")),
+        # Square album art thumbnails from the watch playlist
+        "thumbnails": parse_thumbnails(track.get("thumbnail", [])),
+    }
+
+
+def parse_song_details(result: dict[str, Any]) -> dict[str, Any]:
+    """Parse a get_song response: play count, music type, and playability."""
+    vd = result.get("videoDetails", {})
+    mvt = vd.get("musicVideoType")
+    channel_id = _intern(vd.get("channelId", ""))
+
+    raw_count = vd.get("viewCount")
+    play_count = format_play_count(int(raw_count)) if raw_count else None
+
+    # Auto-generated "Artist - Topic" channels carry the artist's name
+    raw_author = vd.get("author")
+    author = (
+        _intern(raw_author.removesuffix(" - Topic").strip()) if raw_author else ""
+    )
+
+    # Check playability status
+    ps = result.get("playabilityStatus", {})
+    playable = ps.get("status") != "UNPLAYABLE"
+
+    return {
+        "title": vd.get("title"),
+        "isMusic": _IS_MUSIC_BY_TYPE.get(mvt, False),
+        "artists": [{"name": author, "id": channel_id}] if author else [],
+        "album": None,
+        "year": None,
+        "playCount": play_count,
+        "thumbnails": parse_thumbnails(vd.get("thumbnail", {})),
+        "channelId": channel_id,
+        "playable": playable,
+    }
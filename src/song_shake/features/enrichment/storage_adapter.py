@@ -20,12 +20,18 @@ class TinyDBStorageAdapter:
     def save_track(self, track_data: dict) -> None:
         storage.save_track(self._db, track_data)
 
+    def save_tracks_batch(self, tracks: list[dict]) -> None:
+        storage.save_tracks(self._db, tracks)
+
     def get_all_tracks(self, owner: str) -> list[dict]:
         return storage.get_all_tracks(self._db, owner)
 
     def get_track_by_id(self, video_id: str) -> dict | None:
         return storage.get_track_by_id(self._db, video_id)
 
+    def get_tracks_by_ids(self, video_ids: list[str]) -> dict[str, dict]:
+        return storage.get_tracks_by_ids(self._db, video_ids)
+
     def get_tags(self, owner: str) -> list[dict]:
         return storage.get_tags(self._db, owner)
 
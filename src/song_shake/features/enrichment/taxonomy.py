@@ -6,7 +6,7 @@ source of truth for valid tag values.
 """
 
 # fmt: off
-GENRES: list[str] = [
+GENRES: tuple[str, ...] = (
     # Pop
     "Pop", "Synth-pop", "Dance-pop", "Electropop", "Dream-pop", "Bedroom pop",
     "Hyperpop", "K-pop", "J-pop", "Indie pop",
@@ -30,9 +30,9 @@ GENRES: list[str] = [
     "Jazz", "Blues", "Country", "Folk", "Acoustic", "Singer-songwriter",
     "Classical", "Gospel", "Disco", "Reggae", "Dancehall", "Ska", "Dub",
     "Afrobeats", "World", "Sertanejo", "MPB",
-]
+)
 
-MOODS: list[str] = [
+MOODS: tuple[str, ...] = (
     # Positive / High energy
     "Energetic", "Happy", "Upbeat", "Uplifting", "Euphoric", "Celebratory",
     # Romantic / Sensual
@@ -49,9 +49,9 @@ MOODS: list[str] = [
     "Cinematic", "Epic", "Dramatic", "Mysterious", "Haunting",
     # Confident / Bold
     "Confident", "Empowering", "Bold", "Sophisticated", "Contemplative",
-]
+)
 
-INSTRUMENTS: list[str] = [
+INSTRUMENTS: tuple[str, ...] = (
     # Vocals
     "Vocals",
     # Strings
@@ -72,22 +72,27 @@ INSTRUMENTS: list[str] = [
     "French horn", "Oboe", "Harmonica", "Didgeridoo",
     # Electronic
     "Turntables", "Sampler", "Vocoder", "Talk box",
-]
+)
 
-VOCAL_TYPES: list[str] = ["Vocals", "Instrumental"]
+VOCAL_TYPES: tuple[str, ...] = ("Vocals", "Instrumental")
 # fmt: on
 
+# The taxonomy never changes at runtime, so join the prompt strings once.
+_GENRES_PROMPT = ", ".join(GENRES)
+_MOODS_PROMPT = ", ".join(MOODS)
+_INSTRUMENTS_PROMPT = ", ".join(INSTRUMENTS)
+
 
 def genres_prompt_list() -> str:
     """Return genres as a comma-separated string for Gemini prompts."""
-    return ", ".join(GENRES)
+    return _GENRES_PROMPT
 
 
 def moods_prompt_list() -> str:
     """Return moods as a comma-separated string for Gemini prompts."""
-    return ", ".join(MOODS)
+    return _MOODS_PROMPT
 
 
 def instruments_prompt_list() -> str:
     """Return instruments as a comma-separated string for Gemini prompts."""
-    return ", ".join(INSTRUMENTS)
+    return _INSTRUMENTS_PROMPT
@@ -1,10 +1,21 @@
 """Unit tests for enrichment module — TokenTracker + process_playlist with mock adapters."""
 
+import copy
+import threading
+import time
+
 import pytest
+from google.genai import errors as genai_errors
 
+from song_shake.features.enrichment import enrichment
 from song_shake.features.enrichment.enrichment import (
+    SAVE_BATCH_SIZE,
     TokenTracker,
+    _AdaptiveLimit,
+    _EMPTY_METADATA,
+    _SingleFlight,
     _build_track_data,
+    _is_throttle_error,
     process_playlist,
     retry_failed_tracks,
 )
@@ -22,6 +33,8 @@ class FakeStorage:
         self._tracks: dict[str, dict] = dict(existing_tracks) if existing_tracks else {}
         self._history: list[dict] = []
         self.wipe_called = False
+        self.bulk_lookups: list[list[str]] = []
+        self.save_batches: list[list[str]] = []
 
     def wipe_db(self) -> None:
         self._tracks.clear()
@@ -33,12 +46,21 @@ class FakeStorage:
         if vid:
             self._tracks[vid] = track_data
 
+    def save_tracks_batch(self, tracks: list[dict]) -> None:
+        self.save_batches.append([t.get("videoId") for t in tracks])
+        for track_data in tracks:
+            self.save_track(track_data)
+
     def get_all_tracks(self, owner: str) -> list[dict]:
         return [t for t in self._tracks.values() if t.get("owner") == owner]
 
     def get_track_by_id(self, video_id: str) -> dict | None:
         return self._tracks.get(video_id)
 
+    def get_tracks_by_ids(self, video_ids: list[str]) -> dict[str, dict]:
+        self.bulk_lookups.append(list(video_ids))
+        return {vid: self._tracks[vid] for vid in video_ids if vid in self._tracks}
+
     def get_tags(self, owner: str) -> list[dict]:
         return []
 
@@ -91,8 +113,9 @@ class FakeEnricher:
 
     def enrich_by_url(self, video_id: str, title: str, artist: str) -> dict:
         self.calls.append((video_id, title, artist))
-        # Return a copy so each call gets its own dict
-        return dict(self._result)
+        # Callers pop usage_metadata and keep the tag lists in track_data,
+        # so each call needs its own copy, nested values included.
+        return copy.deepcopy(self._result)
 
 
 class FakeEnricherError:
@@ -122,26 +145,27 @@ class FakeSongFetcher:
         playable: bool = True,
         title_map: dict[str, str] | None = None,
     ):
-        self._is_music = is_music
         self._playable = playable
         # Maps video_id → title. When set, get_song returns the mapped title.
         # Use to simulate replaced/gone videos (title mismatch).
         self._title_map = title_map or {}
-
-    def get_song(self, video_id: str) -> dict:
-        # Return mapped title if available, else a generic matching title
-        title = self._title_map.get(video_id)
-        return {
-            "title": title,
-            "isMusic": self._is_music,
+        self.calls: list[str] = []
+        # Nested values are shared across calls, like the real adapter's cache
+        self._template = {
+            "isMusic": is_music,
             "artists": [{"name": "Test Artist", "id": "UC_test"}],
             "album": {"name": "Test Album", "id": "MPRE_test"},
             "year": "2024",
             "playCount": "3.5M",
             "channelId": "UC_test",
-            "playable": self._playable,
+            "playable": playable,
         }
 
+    def get_song(self, video_id: str) -> dict:
+        self.calls.append(video_id)
+        # Return mapped title if available, else a generic matching title
+        return {**self._template, "title": self._title_map.get(video_id)}
+
     def search_playable_alternative(
         self, title: str, artist: str
     ) -> str | None:
@@ -247,6 +271,43 @@ class TestTokenTracker:
         assert tracker.output_tokens == 100
         assert tracker.search_queries == 3
 
+    def test_record_result_from_threads(self):
+        """Concurrent record_result calls should not lose updates."""
+        tracker = TokenTracker()
+        usage = {"prompt_tokens": 3, "candidates_tokens": 2, "search_queries": 1}
+
+        def worker():
+            for n in range(500):
+                tracker.record_result(failed=n % 5 == 0, usage_dict=usage)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert tracker.input_tokens == 4 * 500 * 3
+        assert tracker.search_queries == 4 * 500
+        assert (tracker.successful, tracker.failed) == (1600, 400)
+
+    def test_merge(self):
+        """merge() should add every counter and the errors of another tracker."""
+        tracker = TokenTracker()
+        tracker.record_result(failed=False, usage_dict={"prompt_tokens": 10})
+        other = TokenTracker()
+        other.record_result(
+            failed=True,
+            usage_dict={"prompt_tokens": 5, "candidates_tokens": 7, "search_queries": 2},
+        )
+        other.errors.append("boom")
+
+        tracker.merge(other)
+
+        assert (tracker.input_tokens, tracker.output_tokens) == (15, 7)
+        assert tracker.search_queries == 2
+        assert (tracker.successful, tracker.failed) == (1, 1)
+        assert tracker.errors == ["boom"]
+
     def test_add_usage_from_dict_none(self):
         """Should be a no-op when passed None."""
         tracker = TokenTracker()
@@ -329,6 +390,14 @@ class TestBuildTrackData:
         assert result["status"] == "non-music"
         assert result["success"] is False
 
+    def test_empty_metadata_template_lists_not_shared(self):
+        """Tracks built from the shared empty template get their own lists."""
+        a = _build_track_data("a", "A", _make_track("a"), "o", _EMPTY_METADATA)
+        b = _build_track_data("b", "B", _make_track("b"), "o", _EMPTY_METADATA)
+
+        assert a["genres"] == [] and a["moods"] == [] and a["instruments"] == []
+        assert a["genres"] is not b["genres"]
+
 
 # ===========================================================================
 # process_playlist tests (with mock adapters)
@@ -403,6 +472,257 @@ class TestProcessPlaylist:
         assert len(results) == 1
         assert results[0]["videoId"] == "new1"
 
+    def test_dedup_uses_single_bulk_lookup(self):
+        """Should check the catalog once for all tracks, not per track."""
+        tracks = [_make_track("cached", "Old"), _make_track("new1", "New"), _make_track("new1", "New")]
+        existing = {"cached": {"videoId": "cached", "title": "Old"}}
+        storage = FakeStorage(existing_tracks=existing)
+        enricher = FakeEnricher()
+
+        process_playlist(
+            "PL_BULK",
+            owner="user",
+            storage_port=storage,
+            playlist_fetcher=FakePlaylistFetcher(tracks),
+            audio_enricher=enricher,
+            song_fetcher=FakeSongFetcher(),
+            album_fetcher=FakeAlbumFetcher(),
+        )
+
+        assert storage.bulk_lookups == [["cached", "new1", "new1"]]
+        # Repeated videoId within the playlist is only enriched once
+        assert len(enricher.calls) == 1
+
+    def test_saves_are_batched(self):
+        """Should write processed tracks in batches of SAVE_BATCH_SIZE."""
+        tracks = [_make_track(f"v{i}", f"Song {i}") for i in range(SAVE_BATCH_SIZE + 3)]
+        storage = FakeStorage()
+
+        process_playlist(
+            "PL_BATCH",
+            owner="user",
+            storage_port=storage,
+            playlist_fetcher=FakePlaylistFetcher(tracks),
+            audio_enricher=FakeEnricher(),
+            song_fetcher=FakeSongFetcher(),
+            album_fetcher=FakeAlbumFetcher(),
+        )
+
+        assert [len(b) for b in storage.save_batches] == [SAVE_BATCH_SIZE, 3]
+
+    def test_storage_without_batch_method(self):
+        """Ports lacking save_tracks_batch should fall back to save_track."""
+
+        class LegacyStorage(FakeStorage):
+            save_tracks_batch = None
+
+        storage = LegacyStorage()
+        process_playlist(
+            "PL_LEGACY",
+            owner="user",
+            storage_port=storage,
+            playlist_fetcher=FakePlaylistFetcher([_make_track("v1"), _make_track("v2")]),
+            audio_enricher=FakeEnricher(),
+            song_fetcher=FakeSongFetcher(),
+            album_fetcher=FakeAlbumFetcher(),
+        )
+
+        assert set(storage._tracks) == {"v1", "v2"}
+
+    def test_buffered_saves_flushed_on_cancel(self):
+        """Tracks processed before a cancellation should still be saved."""
+        tracks = [_make_track(f"v{i}", f"Song {i}") for i in range(5)]
+        storage = FakeStorage()
+        cancelled = threading.Event()
+
+        def cancel_check():
+            if cancelled.is_set():
+                raise RuntimeError("cancelled")
+
+        def on_progress(update):
+            if update["message"] == "Processed: Song 2":
+                cancelled.set()
+
+        with pytest.raises(RuntimeError):
+            process_playlist(
+                "PL_CANCEL",
+                owner="user",
+                on_progress=on_progress,
+                cancel_check=cancel_check,
+                storage_port=storage,
+                playlist_fetcher=FakePlaylistFetcher(tracks),
+                audio_enricher=FakeEnricher(),
+                song_fetcher=FakeSongFetcher(),
+                album_fetcher=FakeAlbumFetcher(),
+            )
+
+        assert len(storage.save_batches) == 1
+        assert {"v0", "v1", "v2"} <= set(storage.save_batches[0])
+
+    def test_cancel_keeps_finished_in_flight_tracks(self):
+        """Tracks a worker finished before the cancel should be saved and billed."""
+        tracks = [_make_track("v0", "Song 0"), _make_track("v1", "Song 1")]
+        storage = FakeStorage()
+        cancelled = threading.Event()
+        v1_done = threading.Event()
+        updates: list[dict] = []
+
+        class OrderedEnricher(FakeEnricher):
+            """Finishes v1 first, then cancels the job while finishing v0."""
+            def enrich_by_url(self, video_id, title, artist):
+                if video_id == "v0":
+                    v1_done.wait(timeout=5)
+                    cancelled.set()
+                result = super().enrich_by_url(video_id, title, artist)
+                if video_id == "v1":
+                    v1_done.set()
+                return result
+
+        def cancel_check():
+            if cancelled.is_set():
+                raise RuntimeError("cancelled")
+
+        enricher = OrderedEnricher()
+        with pytest.raises(RuntimeError):
+            process_playlist(
+                "PL_CANCEL",
+                owner="user",
+                max_workers=2,
+                on_progress=updates.append,
+                cancel_check=cancel_check,
+                storage_port=storage,
+                playlist_fetcher=FakePlaylistFetcher(tracks),
+                audio_enricher=enricher,
+                song_fetcher=FakeSongFetcher(),
+                album_fetcher=FakeAlbumFetcher(),
+            )
+
+        assert set(storage._tracks) == {"v0", "v1"}
+        # Both enricher calls were paid for and reach the usage totals
+        assert updates[-1]["tokens"] == 2 * 150
+
+    def test_cancel_skips_gemini_for_queued_tracks(self):
+        """Workers should not start an enricher call once the job is cancelled."""
+        tracks = [_make_track(f"v{i}", f"Song {i}") for i in range(6)]
+        cancelled = threading.Event()
+
+        class CancellingEnricher(FakeEnricher):
+            def enrich_by_url(self, video_id, title, artist):
+                cancelled.set()
+                return super().enrich_by_url(video_id, title, artist)
+
+        def cancel_check():
+            if cancelled.is_set():
+                raise RuntimeError("cancelled")
+
+        enricher = CancellingEnricher()
+        with pytest.raises(RuntimeError):
+            process_playlist(
+                "PL_CANCEL",
+                owner="user",
+                max_workers=1,
+                cancel_check=cancel_check,
+                storage_port=FakeStorage(),
+                playlist_fetcher=FakePlaylistFetcher(tracks),
+                audio_enricher=enricher,
+                song_fetcher=FakeSongFetcher(),
+                album_fetcher=FakeAlbumFetcher(),
+            )
+
+        assert [call[0] for call in enricher.calls] == ["v0"]
+
+    def test_worker_does_not_mutate_playlist_tracks(self):
+        """Rich song metadata should go into track_data, not the fetched track."""
+        track = _make_track("v1")
+        original = dict(track)
+
+        process_playlist(
+            "PL_COPY",
+            owner="user",
+            storage_port=FakeStorage(),
+            playlist_fetcher=FakePlaylistFetcher([track]),
+            audio_enricher=FakeEnricher(),
+            song_fetcher=FakeSongFetcher(),
+            album_fetcher=FakeAlbumFetcher(),
+        )
+
+        assert track == original
+
+    def test_tracks_processed_concurrently(self):
+        """Tracks should be enriched in parallel, results kept in playlist order."""
+        tracks = [_make_track(f"v{i}", f"Song {i}") for i in range(3)]
+        barrier = threading.Barrier(3, timeout=5)
+
+        class BarrierEnricher(FakeEnricher):
+            """Blocks until all three tracks are being enriched at once."""
+            def enrich_by_url(self, video_id, title, artist):
+                barrier.wait()
+                return super().enrich_by_url(video_id, title, artist)
+
+        results = process_playlist(
+            "PL_PARALLEL",
+            owner="user",
+            max_workers=3,
+            storage_port=FakeStorage(),
+            playlist_fetcher=FakePlaylistFetcher(tracks),
+            audio_enricher=BarrierEnricher(),
+            song_fetcher=FakeSongFetcher(),
+            album_fetcher=FakeAlbumFetcher(),
+        )
+
+        assert [r["videoId"] for r in results] == ["v0", "v1", "v2"]
+
+    def test_album_fetched_once_per_album(self):
+        """Concurrent tracks sharing an album should trigger one get_album call."""
+
+        class NoYearSongFetcher(FakeSongFetcher):
+            def get_song(self, video_id):
+                return {**super().get_song(video_id), "year": None}
+
+        class CountingAlbumFetcher(FakeAlbumFetcher):
+            def __init__(self):
+                super().__init__(year="1999")
+                self.calls: list[str] = []
+
+            def get_album(self, browse_id):
+                self.calls.append(browse_id)
+                time.sleep(0.01)  # widen the window for concurrent misses
+                return super().get_album(browse_id)
+
+        album_fetcher = CountingAlbumFetcher()
+        results = process_playlist(
+            "PL_ALBUM",
+            owner="user",
+            max_workers=6,
+            storage_port=FakeStorage(),
+            playlist_fetcher=FakePlaylistFetcher([_make_track(f"v{i}") for i in range(6)]),
+            audio_enricher=FakeEnricher(),
+            song_fetcher=NoYearSongFetcher(),
+            album_fetcher=album_fetcher,
+        )
+
+        assert album_fetcher.calls == ["MPRE_test"]
+        assert {r["year"] for r in results} == {"1999"}
+
+    def test_song_metadata_fetched_once_per_track(self):
+        """Should fetch song metadata exactly once for each uncached track."""
+        tracks = [_make_track(f"v{i}", f"Song {i}") for i in range(4)]
+        existing = {"v1": {"videoId": "v1", "title": "Song 1"}}
+        song_fetcher = FakeSongFetcher()
+
+        results = process_playlist(
+            "PL_FETCH_ONCE",
+            owner="user",
+            storage_port=FakeStorage(existing_tracks=existing),
+            playlist_fetcher=FakePlaylistFetcher(tracks),
+            audio_enricher=FakeEnricher(),
+            song_fetcher=song_fetcher,
+            album_fetcher=FakeAlbumFetcher(),
+        )
+
+        assert [r["videoId"] for r in results] == ["v0", "v2", "v3"]
+        assert sorted(song_fetcher.calls) == ["v0", "v2", "v3"]
+
     def test_empty_playlist(self):
         """Should return empty list when playlist has no tracks."""
         storage = FakeStorage()
@@ -461,6 +781,56 @@ class TestProcessPlaylist:
         assert results[0]["status"] == "error"
         assert "Gemini API timeout" in results[0]["error_message"]
 
+    def test_transient_enrich_error_retried(self, monkeypatch):
+        """Throttling errors should be retried with backoff until they succeed."""
+        monkeypatch.setattr(enrichment, "ENRICH_RETRY_BACKOFF", 0)
+        tracks = [_make_track("flaky", "Flaky Song")]
+
+        class FlakyEnricher(FakeEnricher):
+            def enrich_by_url(self, video_id, title, artist):
+                if len(self.calls) < 2:
+                    self.calls.append((video_id, title, artist))
+                    raise genai_errors.ServerError(503, {"error": {"status": "UNAVAILABLE"}})
+                return super().enrich_by_url(video_id, title, artist)
+
+        enricher = FlakyEnricher()
+        results = process_playlist(
+            "PL_FLAKY",
+            owner="user",
+            storage_port=FakeStorage(),
+            playlist_fetcher=FakePlaylistFetcher(tracks),
+            audio_enricher=enricher,
+            song_fetcher=FakeSongFetcher(),
+            album_fetcher=FakeAlbumFetcher(),
+        )
+
+        assert results[0]["status"] == "success"
+        assert len(enricher.calls) == 3
+
+    def test_persistent_throttling_gives_up(self, monkeypatch):
+        """After ENRICH_ATTEMPTS throttled calls the track is saved as an error."""
+        monkeypatch.setattr(enrichment, "ENRICH_RETRY_BACKOFF", 0)
+        tracks = [_make_track("limited", "Limited Song")]
+        calls: list[str] = []
+
+        class ThrottledEnricher:
+            def enrich_by_url(self, video_id, title, artist):
+                calls.append(video_id)
+                raise genai_errors.ClientError(429, {"error": {"status": "RESOURCE_EXHAUSTED"}})
+
+        results = process_playlist(
+            "PL_LIMITED",
+            owner="user",
+            storage_port=FakeStorage(),
+            playlist_fetcher=FakePlaylistFetcher(tracks),
+            audio_enricher=ThrottledEnricher(),
+            song_fetcher=FakeSongFetcher(),
+            album_fetcher=FakeAlbumFetcher(),
+        )
+
+        assert results[0]["status"] == "error"
+        assert len(calls) == enrichment.ENRICH_ATTEMPTS
+
     def test_wipe_flag(self):
         """Should re-process cached tracks when wipe=True (skip dedup)."""
         tracks = [_make_track("v1", "Song A", "Art A")]
@@ -513,6 +883,32 @@ class TestProcessPlaylist:
             assert "tokens" in call
             assert "cost" in call
 
+    def test_status_progress_is_throttled(self, monkeypatch):
+        """Status-only reports are rate-limited; the final report always goes out."""
+        monkeypatch.setattr(enrichment, "PROGRESS_MIN_INTERVAL", 3600)
+        tracks = [_make_track(f"thr{i}") for i in range(5)]
+        storage = FakeStorage()
+        for t in tracks:
+            storage.save_track({"videoId": t["videoId"], "title": "Song"})
+        progress_calls: list[dict] = []
+
+        process_playlist(
+            "PL_THROTTLE",
+            owner="user",
+            on_progress=progress_calls.append,
+            storage_port=storage,
+            playlist_fetcher=FakePlaylistFetcher(tracks),
+            audio_enricher=FakeEnricher(),
+            song_fetcher=FakeSongFetcher(),
+            album_fetcher=FakeAlbumFetcher(),
+        )
+
+        # All tracks are cached: only the start and the forced finish remain
+        assert [c["message"] for c in progress_calls] == [
+            "Fetching tracks...",
+            "Enrichment complete",
+        ]
+
     def test_track_without_video_id_skipped(self):
         """Should skip tracks that have no videoId."""
         tracks = [{"title": "No ID Track", "artists": []}]
@@ -623,6 +1019,106 @@ class TestRetryFailedTracks:
         assert storage._tracks["v1"]["status"] == "success"
         assert storage._tracks["v2"]["status"] == "success"
 
+    def test_retry_default_song_fetcher_skips_cache(self, monkeypatch):
+        """Retries should re-check YTMusic, not reuse a cached get_song answer."""
+        from song_shake.features.enrichment import song_adapter
+
+        class FakeYTMusic:
+            def __init__(self):
+                self.song_calls: list[str] = []
+
+            def get_song(self, video_id):
+                self.song_calls.append(video_id)
+                return {
+                    "videoDetails": {"title": "Track 1"},
+                    "playabilityStatus": {"status": "OK"},
+                }
+
+            def get_watch_playlist(self, video_id):
+                return {}
+
+        yt = FakeYTMusic()
+        monkeypatch.setattr(song_adapter, "public_ytmusic", lambda: yt)
+        monkeypatch.setattr(song_adapter, "_song_cache", {})
+        monkeypatch.setattr(song_adapter, "_watch_cache", {})
+        # An earlier enrichment run cached the song
+        song_adapter.YTMusicSongAdapter().get_song("v1")
+
+        retry_failed_tracks(
+            owner="user",
+            storage_port=FakeStorage({"v1": self._make_failed_track("v1", "Track 1")}),
+            audio_enricher=FakeEnricher(),
+            album_fetcher=FakeAlbumFetcher(),
+        )
+
+        assert yt.song_calls == ["v1", "v1"]
+
+    def test_retry_skips_tracks_without_video_id(self):
+        """Failed entries lacking a videoId should not reach the fetchers."""
+        orphan = self._make_failed_track("", "No ID")
+        storage = FakeStorage({"v1": self._make_failed_track("v1", "Track 1")})
+        storage.get_failed_tracks = lambda owner: [orphan, storage._tracks["v1"]]
+        song_fetcher = FakeSongFetcher()
+
+        result = retry_failed_tracks(
+            owner="user",
+            storage_port=storage,
+            audio_enricher=FakeEnricher(),
+            song_fetcher=song_fetcher,
+            album_fetcher=FakeAlbumFetcher(),
+        )
+
+        assert [r["videoId"] for r in result] == ["v1"]
+        assert song_fetcher.calls == ["v1"]
+
+    def test_retry_runs_tracks_concurrently(self):
+        """Tracks should be enriched in parallel, results kept in input order."""
+        failed = [self._make_failed_track(f"v{i}", f"Track {i}") for i in range(3)]
+        storage = FakeStorage({t["videoId"]: t for t in failed})
+        barrier = threading.Barrier(3, timeout=5)
+
+        class BarrierEnricher(FakeEnricher):
+            """Blocks until all three tracks are being enriched at once."""
+            def enrich_by_url(self, video_id, title, artist):
+                barrier.wait()
+                return super().enrich_by_url(video_id, title, artist)
+
+        enricher = BarrierEnricher()
+        result = retry_failed_tracks(
+            owner="user",
+            max_workers=3,
+            storage_port=storage,
+            audio_enricher=enricher,
+            song_fetcher=FakeSongFetcher(),
+            album_fetcher=FakeAlbumFetcher(),
+        )
+
+        assert [r["videoId"] for r in result] == ["v0", "v1", "v2"]
+        assert len(enricher.calls) == 3
+
+    def test_retry_cancel_skips_pending_tracks(self):
+        """A cancellation should abort the sweep without retrying the rest."""
+        failed = [self._make_failed_track(f"v{i}", f"Track {i}") for i in range(5)]
+        storage = FakeStorage({t["videoId"]: t for t in failed})
+        enricher = FakeEnricher()
+
+        def cancel_check():
+            if enricher.calls:
+                raise RuntimeError("cancelled")
+
+        with pytest.raises(RuntimeError):
+            retry_failed_tracks(
+                owner="user",
+                cancel_check=cancel_check,
+                max_workers=1,
+                storage_port=storage,
+                audio_enricher=enricher,
+                song_fetcher=FakeSongFetcher(),
+                album_fetcher=FakeAlbumFetcher(),
+            )
+
+        assert len(enricher.calls) == 1
+
     def test_retry_unplayable_fallback(self):
         """UNPLAYABLE track should use search_playable_alternative."""
         t1 = self._make_failed_track("v1", "Unavailable Song")
@@ -757,3 +1253,178 @@ class TestRetryFailedTracks:
         assert result[0]["title"] == "Time Goes By"
         # Metadata should come from the alternative video
         assert storage._tracks["v1"]["playableVideoId"] == "ALT_VIDEO_ID"
+
+
+# ===========================================================================
+# _SingleFlight tests
+# ===========================================================================
+
+
+class TestSingleFlight:
+    """Tests for the in-flight call coalescer."""
+
+    def test_concurrent_same_key_runs_once(self):
+        """Callers for an in-flight key should share the leader's result."""
+        flight = _SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls: list[str] = []
+
+        def slow_lookup(key: str) -> str:
+            calls.append(key)
+            started.set()
+            release.wait(timeout=5)
+            return f"alt-{key}"
+
+        results: list[str] = []
+        leader = threading.Thread(
+            target=lambda: results.append(flight.do("k", slow_lookup, "k"))
+        )
+        leader.start()
+        started.wait(timeout=5)
+        follower = threading.Thread(
+            target=lambda: results.append(flight.do("k", slow_lookup, "k"))
+        )
+        follower.start()
+        time.sleep(0.05)
+        release.set()
+        leader.join()
+        follower.join()
+
+        assert calls == ["k"]
+        assert results == ["alt-k", "alt-k"]
+
+    def test_sequential_calls_are_not_cached(self):
+        """Once a call finishes, the next call for the key runs again."""
+        flight = _SingleFlight()
+        calls: list[int] = []
+
+        def lookup(n: int) -> int:
+            calls.append(n)
+            return n
+
+        assert flight.do("k", lookup, 1) == 1
+        assert flight.do("k", lookup, 2) == 2
+        assert calls == [1, 2]
+
+    def test_exception_propagates_and_clears_key(self):
+        """A failing call should raise and not leave the key in flight."""
+        flight = _SingleFlight()
+
+        def boom() -> None:
+            raise RuntimeError("lookup failed")
+
+        with pytest.raises(RuntimeError):
+            flight.do("k", boom)
+        assert flight.do("k", lambda: "ok") == "ok"
+
+
+class TestIsThrottleError:
+    """Tests for _is_throttle_error()."""
+
+    @pytest.mark.parametrize(
+        "exc",
+        [
+            genai_errors.ClientError(429, {"error": {"status": "RESOURCE_EXHAUSTED"}}),
+            genai_errors.ServerError(503, {"error": {"status": "UNAVAILABLE"}}),
+            TimeoutError("read timed out"),
+            ConnectionError("reset"),
+        ],
+    )
+    def test_structured_throttling(self, exc):
+        """Status codes 429/503 and network errors are transient."""
+        assert _is_throttle_error(exc)
+
+    @pytest.mark.parametrize(
+        "exc",
+        [
+            ValueError("bad JSON for video abc429xyz at offset 503"),
+            genai_errors.ClientError(400, {"error": {"message": "video id x429 invalid"}}),
+            RuntimeError("429 RESOURCE_EXHAUSTED"),
+        ],
+    )
+    def test_status_like_text_is_not_throttling(self, exc):
+        """Digits in the message text must not count as a status code."""
+        assert not _is_throttle_error(exc)
+
+
+class TestAdaptiveLimit:
+    """Tests for the AIMD enricher concurrency cap."""
+
+    def test_throttle_error_halves_limit(self):
+        """A 429 failure should halve the cap and re-raise."""
+        limit = _AdaptiveLimit(8)
+
+        def throttled() -> None:
+            raise genai_errors.ClientError(429, {"error": {"status": "RESOURCE_EXHAUSTED"}})
+
+        with pytest.raises(genai_errors.ClientError):
+            limit.run(throttled)
+        assert limit.limit == 4
+
+    def test_success_grows_back_to_ceiling(self):
+        """Successful calls add one slot at a time, never past the ceiling."""
+        limit = _AdaptiveLimit(4)
+        limit.limit = 1
+
+        for _ in range(10):
+            assert limit.run(lambda: "ok") == "ok"
+
+        assert limit.limit == 4
+
+    def test_status_digits_in_message_do_not_shrink(self):
+        """A generic error mentioning 503 must leave the cap unchanged."""
+        limit = _AdaptiveLimit(4)
+
+        def bad_response() -> None:
+            raise ValueError("unexpected token at offset 503")
+
+        with pytest.raises(ValueError):
+            limit.run(bad_response)
+        assert limit.limit == 4
+
+    def test_network_errors_do_not_shrink(self):
+        """Timeouts are retried, but only 429/503 answers shrink the cap."""
+        limit = _AdaptiveLimit(4)
+
+        def timeout() -> None:
+            raise TimeoutError("read timed out")
+
+        with pytest.raises(TimeoutError):
+            limit.run(timeout)
+        assert limit.limit == 4
+
+    def test_other_errors_do_not_shrink(self):
+        """Non-throttling failures should leave the cap alone."""
+        limit = _AdaptiveLimit(4)
+
+        def bad_response() -> None:
+            raise ValueError("bad json")
+
+        with pytest.raises(ValueError):
+            limit.run(bad_response)
+        assert limit.limit == 4
+
+    def test_calls_over_limit_wait(self):
+        """No more than `limit` calls should run at once."""
+        limit = _AdaptiveLimit(2)
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def work() -> None:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+
+        threads = [threading.Thread(target=limit.run, args=(work,)) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert peak <= 2
@@ -0,0 +1,60 @@
+"""Unit tests for enrichment route helpers."""
+
+from song_shake.features.enrichment.routes import _TaskStore
+
+
+class TestTaskStore:
+    """Tests for the bounded in-memory enrichment task map."""
+
+    def test_evicts_oldest_finished_tasks_only(self):
+        """Running tasks must survive eviction even when they are the oldest."""
+        tasks = _TaskStore(maxsize=2)
+        tasks["running"] = {"status": "running"}
+        tasks["done_1"] = {"status": "completed"}
+        tasks["done_2"] = {"status": "error"}
+
+        tasks["new"] = {"status": "pending"}
+
+        assert list(tasks) == ["running", "new"]
+
+    def test_stays_over_capacity_while_all_tasks_active(self):
+        """Nothing is evicted if every task is still pending or running."""
+        tasks = _TaskStore(maxsize=1)
+        tasks["a"] = {"status": "running"}
+        tasks["b"] = {"status": "pending"}
+
+        assert "a" in tasks and "b" in tasks
+
+    def test_reads_do_not_reorder(self):
+        """Reading a task must not change which finished task is evicted next."""
+        tasks = _TaskStore(maxsize=2)
+        tasks["old"] = {"status": "completed"}
+        tasks["newer"] = {"status": "completed"}
+        assert tasks["old"]["status"] == "completed"
+        assert tasks.get("old") is not None
+
+        tasks["newest"] = {"status": "pending"}
+
+        assert "old" not in tasks
+        assert list(tasks) == ["newer", "newest"]
+
+    def test_iteration_is_a_snapshot(self):
+        """Adding tasks while iterating must not break the iteration."""
+        tasks = _TaskStore(maxsize=10)
+        tasks["a"] = {"status": "running"}
+
+        for task_id in tasks:
+            tasks[f"{task_id}-child"] = {"status": "pending"}
+
+        assert list(tasks) == ["a", "a-child"]
+        assert tasks.items() == [("a", {"status": "running"}),
+                                 ("a-child", {"status": "pending"})]
+
+    def test_pop_and_setdefault(self):
+        """pop/setdefault take the lock too and must not deadlock on it."""
+        tasks = _TaskStore(maxsize=10)
+        tasks.setdefault("a", {"status": "running"})
+
+        assert tasks.pop("a") == {"status": "running"}
+        assert tasks.pop("a", None) is None
+        assert len(tasks) == 0
@@ -0,0 +1,67 @@
+"""Unit tests for the YTMusic song adapter's response cache."""
+
+import pytest
+
+from song_shake.features.enrichment import song_adapter
+from song_shake.features.enrichment.song_adapter import YTMusicSongAdapter
+
+
+class FakeYTMusic:
+    """Answers get_song/get_watch_playlist with a mutable playability."""
+
+    def __init__(self):
+        self.status = "OK"
+        self.song_calls = 0
+
+    def get_song(self, video_id):
+        self.song_calls += 1
+        return {
+            "videoDetails": {"title": f"Title {video_id}", "viewCount": "10"},
+            "playabilityStatus": {"status": self.status},
+        }
+
+    def get_watch_playlist(self, video_id):
+        return {}
+
+
+@pytest.fixture(autouse=True)
+def _empty_caches():
+    song_adapter._song_cache.clear()
+    song_adapter._watch_cache.clear()
+    yield
+    song_adapter._song_cache.clear()
+    song_adapter._watch_cache.clear()
+
+
+class TestSongCache:
+    def test_cached_response_reused(self):
+        yt = FakeYTMusic()
+        adapter = YTMusicSongAdapter(yt=yt)
+
+        adapter.get_song("v1")
+        yt.status = "UNPLAYABLE"
+
+        assert adapter.get_song("v1")["playable"] is True
+        assert yt.song_calls == 1
+
+    def test_zero_ttl_bypasses_cache(self):
+        """A cache_ttl=0 adapter should see fresh data, not a cached answer."""
+        yt = FakeYTMusic()
+        YTMusicSongAdapter(yt=yt).get_song("v1")
+        yt.status = "UNPLAYABLE"
+
+        fresh = YTMusicSongAdapter(yt=yt, cache_ttl=0, negative_cache_ttl=0)
+
+        assert fresh.get_song("v1")["playable"] is False
+        assert yt.song_calls == 2
+
+    def test_zero_ttl_evicts_stale_entry(self):
+        """After a fresh lookup, cached adapters should not serve the old answer."""
+        yt = FakeYTMusic()
+        cached = YTMusicSongAdapter(yt=yt)
+        cached.get_song("v1")
+        yt.status = "UNPLAYABLE"
+
+        YTMusicSongAdapter(yt=yt, cache_ttl=0, negative_cache_ttl=0).get_song("v1")
+
+        assert cached.get_song("v1")["playable"] is False
@@ -0,0 +1,95 @@
+"""Unit tests for YTMusic song response parsing."""
+
+import pytest
+
+from song_shake.features.enrichment.song_parse import (
+    format_play_count,
+    parse_song_details,
+    parse_watch_track,
+)
+
+
+class TestFormatPlayCount:
+    """Tests for format_play_count()."""
+
+    @pytest.mark.parametrize(
+        ("count", "expected"),
+        [
+            (None, None),
+            (0, "0"),
+            (999, "999"),
+            (1_000, "1K"),
+            (1_500, "1.5K"),
+            (1_960, "2K"),
+            (123_456, "123K"),
+            (999_999, "999K"),
+            (3_500_000, "3.5M"),
+            (2_000_000_000, "2B"),
+        ],
+    )
+    def test_formats(self, count, expected):
+        """Should abbreviate with one decimal, dropping a trailing .0."""
+        assert format_play_count(count) == expected
+
+
+class TestParseWatchTrack:
+    """Tests for parse_watch_track()."""
+
+    def test_normalizes_fields(self):
+        """Should normalize artists, album and nested thumbnails."""
+        track = {
+            "videoType": "MUSIC_VIDEO_TYPE_ATV",
+            "artists": [{"name": "Artist", "id": "UC1"}, "Featured"],
+            "album": {"name": "Album", "id": "MPRE1"},
+            "year": "2020",
+            "thumbnail": {"thumbnails": [{"url": "u", "width": 60}, {"width": 1}]},
+        }
+
+        result = parse_watch_track(track)
+
+        assert result == {
+            "isMusic": True,
+            "artists": [
+                {"name": "Artist", "id": "UC1"},
+                {"name": "Featured", "id": None},
+            ],
+            "album": {"name": "Album", "id": "MPRE1"},
+            "year": "2020",
+            "thumbnails": [{"url": "u", "width": 60, "height": None}],
+        }
+
+    def test_unknown_video_type_is_not_music(self):
+        """A present but unrecognized video type should mean non-music."""
+        assert parse_watch_track({"videoType": "OTHER"})["isMusic"] is False
+        assert parse_watch_track({})["isMusic"] is None
+
+    def test_interns_repeated_names(self):
+        """Equal artist names parsed from separate responses share one object."""
+        first = parse_watch_track({"artists": [{"name": "".join(["Art", "ist"])}]})
+        second = parse_watch_track({"artists": [{"name": "".join(["Art", "ist"])}]})
+
+        assert first["artists"][0]["name"] is second["artists"][0]["name"]
+
+
+class TestParseSongDetails:
+    """Tests for parse_song_details()."""
+
+    def test_parses_video_details(self):
+        """Should strip the Topic suffix and detect unplayable videos."""
+        result = parse_song_details({
+            "videoDetails": {
+                "title": "Song",
+                "author": "Artist - Topic",
+                "channelId": "UC1",
+                "musicVideoType": "MUSIC_VIDEO_TYPE_OMV",
+                "viewCount": "1500",
+            },
+            "playabilityStatus": {"status": "UNPLAYABLE"},
+        })
+
+        assert result["title"] == "Song"
+        assert result["artists"] == [{"name": "Artist", "id": "UC1"}]
+        assert result["channelId"] == "UC1"
+        assert result["playCount"] == "1.5K"
+        assert result["isMusic"] is True
+        assert result["playable"] is False
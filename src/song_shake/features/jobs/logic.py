@@ -1,11 +1,19 @@
 """Background job execution logic.
 
 Wraps ``process_playlist`` and keeps the Job record up-to-date while the
-enrichment runs.  Cancellation is achieved via a ``threading.Event``.
+enrichment runs.  Cancellation is signalled through a ``_CancelToken``.
+
+In-memory live state is published as immutable snapshots: a new dict is
+built completely and then stored with a single (GIL-atomic) assignment,
+so readers never need a lock.  Only compound read-modify-write updates
+take ``_live_state_lock``.
 """
 
+import asyncio
 import os
 import threading
+import time
+from collections.abc import Callable
 from datetime import datetime, timezone
 
 from song_shake.features.enrichment import enrichment
@@ -18,8 +26,22 @@ logger = get_logger(__name__)
 
 
 
-# In-memory map of job_id → threading.Event for cancellation
-_cancel_events: dict[str, threading.Event] = {}
+class _CancelToken:
+    """Cancellation flag checked on every enrichment iteration.
+
+    A plain slotted attribute instead of ``threading.Event``: reads and
+    writes of a single attribute are atomic under the GIL, so checking it
+    needs no lock.
+    """
+
+    __slots__ = ("cancelled",)
+
+    def __init__(self) -> None:
+        self.cancelled = False
+
+
+# In-memory map of job_id → cancel token
+_cancel_events: dict[str, _CancelToken] = {}
 
 # In-memory map of job_id → latest state for fast SSE reads
 _job_live_state: dict[str, dict] = {}
@@ -27,100 +49,301 @@ _job_live_state: dict[str, dict] = {}
 # In-memory latest AI usage for SSE broadcast (owner → counters)
 _ai_usage_live: dict[str, dict] = {}
 
-# Lock protecting all three in-memory dicts above.
-# Needed because compound operations (read-modify-write) aren't atomic
-# even under Python's GIL when multiple background threads access them.
+# Finished jobs' live state is kept this long so late SSE (re)connects can
+# still read the final state; after that the DB record serves it.
+LIVE_STATE_TTL = 300.0
+# Owners' live AI usage is dropped this long after their last job ends
+# (the SSE stream falls back to the persisted totals).
+AI_USAGE_LIVE_TTL = 3600.0
+
+# job_id → monotonic finish time, in finish order
+_job_finished_at: dict[str, float] = {}
+# owner → number of running jobs
+_owner_running_jobs: dict[str, int] = {}
+# owner → monotonic time their last running job finished, in that order
+_owner_idle_since: dict[str, float] = {}
+
+# SSE streams waiting for a job's next live-state update:
+# job_id → {asyncio.Event: the event loop it belongs to}
+_job_listeners: dict[str, dict[asyncio.Event, asyncio.AbstractEventLoop]] = {}
+
+# SSE streams waiting for an owner's next live AI usage update (same shape)
+_ai_usage_listeners: dict[str, dict[asyncio.Event, asyncio.AbstractEventLoop]] = {}
+
+# Lock serializing compound (read-modify-write) updates of the in-memory
+# dicts above, which aren't atomic even under Python's GIL when multiple
+# background threads access them.
+# Writers always publish a freshly built dict and never mutate a published
+# one in place, so readers can take a single dict.get() without the lock.
+# A job's _job_live_state entry has one writer at a time: its progress
+# callbacks are serialized (process_playlist calls them from the job's
+# thread; retry_failed_tracks calls them from pool workers, but always
+# under its progress lock) and finalisation runs after the task returns.
+# So publishing it is a single atomic store that needs no lock either.
 _live_state_lock = threading.Lock()
 
 
-def get_cancel_event(job_id: str) -> threading.Event | None:
-    """Return the cancellation event for a job, or None if not tracked."""
-    with _live_state_lock:
-        return _cancel_events.get(job_id)
+def get_cancel_token(job_id: str) -> _CancelToken | None:
+    """Return the cancellation token for a job, or None if not tracked."""
+    return _cancel_events.get(job_id)
 
 
 def get_live_state(job_id: str) -> dict | None:
-    """Return the live in-memory state for a job (for SSE)."""
+    """Return the live in-memory state for a job (for SSE).
+
+    The returned dict is a published snapshot; treat it as read-only.
+    """
+    return _job_live_state.get(job_id)
+
+
+def _subscribe(registry: dict, key: str) -> asyncio.Event:
+    event = asyncio.Event()
+    loop = asyncio.get_running_loop()
     with _live_state_lock:
-        state = _job_live_state.get(job_id)
-        return state.copy() if state else None
+        registry.setdefault(key, {})[event] = loop
+    return event
 
 
-def get_live_ai_usage(owner: str) -> dict | None:
-    """Return the live in-memory AI usage for an owner (for SSE)."""
+def _unsubscribe(registry: dict, key: str, event: asyncio.Event) -> None:
     with _live_state_lock:
-        usage = _ai_usage_live.get(owner)
-        return usage.copy() if usage else None
+        listeners = registry.get(key)
+        if listeners is not None:
+            listeners.pop(event, None)
+            if not listeners:
+                del registry[key]
+
+
+def _notify(registry: dict, key: str) -> None:
+    with _live_state_lock:
+        listeners = list(registry.get(key, {}).items())
+    for event, loop in listeners:
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            pass  # Loop already closed — the stream is gone
+
+
+def subscribe_job(job_id: str) -> asyncio.Event:
+    """Return an event (on the running loop) set whenever the job's live state changes.
+
+    Call from async code; pair with unsubscribe_job when the stream ends.
+    """
+    return _subscribe(_job_listeners, job_id)
+
+
+def unsubscribe_job(job_id: str, event: asyncio.Event) -> None:
+    """Stop notifying an event registered with subscribe_job."""
+    _unsubscribe(_job_listeners, job_id, event)
+
+
+def _notify_job(job_id: str) -> None:
+    """Wake the SSE streams subscribed to a job (callable from any thread)."""
+    _notify(_job_listeners, job_id)
+
+
+def subscribe_ai_usage(owner: str) -> asyncio.Event:
+    """Return an event (on the running loop) set whenever the owner's live AI usage changes.
+
+    Call from async code; pair with unsubscribe_ai_usage when the stream ends.
+    """
+    return _subscribe(_ai_usage_listeners, owner)
+
+
+def unsubscribe_ai_usage(owner: str, event: asyncio.Event) -> None:
+    """Stop notifying an event registered with subscribe_ai_usage."""
+    _unsubscribe(_ai_usage_listeners, owner, event)
+
+
+def _notify_ai_usage(owner: str) -> None:
+    """Wake the SSE streams subscribed to an owner's AI usage (any thread)."""
+    _notify(_ai_usage_listeners, owner)
+
+
+def get_live_ai_usage(owner: str) -> dict | None:
+    """Return the live in-memory AI usage for an owner (for SSE).
+
+    The returned dict is a published snapshot; treat it as read-only.
+    """
+    return _ai_usage_live.get(owner)
+
+
+def _prune_live_state(now: float) -> None:
+    """Evict expired finished-job state and idle owners' live AI usage.
+
+    Caller must hold ``_live_state_lock``.
+    """
+    for job_id, finished_at in list(_job_finished_at.items()):
+        if now - finished_at < LIVE_STATE_TTL:
+            break  # Later entries finished even more recently
+        del _job_finished_at[job_id]
+        _job_live_state.pop(job_id, None)
+    for owner, idle_since in list(_owner_idle_since.items()):
+        if now - idle_since < AI_USAGE_LIVE_TTL:
+            break
+        del _owner_idle_since[owner]
+        _ai_usage_live.pop(owner, None)
 
 
 class CancelledError(Exception):
     """Raised when a job is cancelled."""
 
 
-def run_enrichment_job(
-    job_id: str,
-    playlist_id: str,
-    owner: str,
-    api_key: str,
-    wipe: bool = False,
-    job_store: JobStoragePort | None = None,
-    playlist_fetcher=None,
-) -> None:
-    """Run the enrichment process as a background job.
+# Minimum seconds between persisted AI-usage writes for one job.
+# Caps storage writes at about one per second per job, while keeping the
+# persisted totals well within the 5s reconcile interval of
+# /jobs/ai-usage/stream, which is how streams on other instances see them.
+AI_USAGE_FLUSH_INTERVAL = 1.0
 
-    Updates the Job record on each progress tick and on
-    completion/error/cancellation.
 
-    Args:
-        job_store: Optional JobStoragePort adapter. Falls back to factory
-            default when not provided (production default).
+class _AiUsageWriter:
+    """Accumulate a job's AI usage deltas and persist them in batches.
+
+    ``add`` writes through ``update_ai_usage`` at most once per
+    AI_USAGE_FLUSH_INTERVAL; ``flush`` writes whatever is still pending
+    and must be called when the job ends.
     """
-    if job_store is None:
-        job_store = get_jobs_storage()
 
-    cancel_event = threading.Event()
-    with _live_state_lock:
-        _cancel_events[job_id] = cancel_event
+    def __init__(self, job_store: JobStoragePort, owner: str) -> None:
+        self._job_store = job_store
+        self._owner = owner
+        self._tokens = 0
+        self._cost = 0.0
+        self._last_flush = time.monotonic()
+
+    def add(self, delta_tokens: int, delta_cost: float) -> None:
+        self._tokens += delta_tokens
+        self._cost += delta_cost
+        if time.monotonic() - self._last_flush >= AI_USAGE_FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        self._last_flush = time.monotonic()
+        if self._tokens <= 0 and self._cost <= 0:
+            return
+        tokens, cost = self._tokens, self._cost
+        self._tokens, self._cost = 0, 0.0
+        try:
+            updated = self._job_store.update_ai_usage(self._owner, tokens, 0, cost)
+        except Exception as e:
+            # Best-effort — the job record keeps the job's own usage
+            logger.warning("ai_usage_update_failed", owner=self._owner, error=str(e))
+            return
+        # The live value already includes this writer's deltas (added per
+        # tick) plus other running jobs' unflushed ones, so only let the
+        # persisted totals move it forward (e.g. writes from other instances).
+        with _live_state_lock:
+            live = _ai_usage_live.get(self._owner)
+            _ai_usage_live[self._owner] = {
+                key: max(updated.get(key, 0), live.get(key, 0)) if live else updated.get(key, 0)
+                for key in ("input_tokens", "output_tokens", "cost")
+            }
+        _notify_ai_usage(self._owner)
 
-    # Load persisted all-time AI usage as the baseline for live updates
-    baseline_usage = job_store.get_ai_usage(owner)
-    baseline_tokens_in = baseline_usage.get("input_tokens", 0)
-    baseline_tokens_out = baseline_usage.get("output_tokens", 0)
-    baseline_cost = baseline_usage.get("cost", 0.0)
 
-    # Initialise live state
-    with _live_state_lock:
-        _job_live_state[job_id] = {
-            "id": job_id,
-            "status": JobStatus.RUNNING.value,
-            "total": 0,
-            "current": 0,
-            "message": "Initializing…",
-            "errors": [],
-            "ai_usage": {"input_tokens": 0, "output_tokens": 0, "cost": 0.0},
-        }
+# Minimum seconds between persisted progress writes for one job.
+# Ticks in between are combined: only the latest progress is written.
+JOB_PROGRESS_FLUSH_INTERVAL = 2.0
+
+
+class _JobProgressWriter:
+    """Write-combine a job's progress updates.
+
+    ``add`` keeps only the latest pending fields and writes them through
+    ``update_job`` at most once per JOB_PROGRESS_FLUSH_INTERVAL (or
+    immediately when forced). Each update carries the full progress and
+    errors, so a newer one fully supersedes any older pending one.
+    """
+
+    def __init__(self, job_store: JobStoragePort, job_id: str) -> None:
+        self._job_store = job_store
+        self._job_id = job_id
+        self._pending: dict | None = None
+        self._last_flush = time.monotonic()
+
+    def add(self, fields: dict, *, force: bool = False) -> None:
+        self._pending = fields
+        if force or time.monotonic() - self._last_flush >= JOB_PROGRESS_FLUSH_INTERVAL:
+            self.flush()
 
-        # Ensure live AI usage reflects the DB baseline (don't overwrite
-        # if another job already seeded it — it would be equal or larger).
-        if owner not in _ai_usage_live:
-            _ai_usage_live[owner] = baseline_usage.copy()
+    def flush(self, **final_fields: object) -> None:
+        """Write pending progress, merged with ``final_fields`` if given."""
+        fields = {**self._pending, **final_fields} if self._pending else final_fields
+        self._pending = None
+        self._last_flush = time.monotonic()
+        if fields:
+            self._job_store.update_job(self._job_id, fields)
 
-    job_errors: list[dict] = []
-    job_ai_usage = {"input_tokens": 0, "output_tokens": 0, "cost": 0.0}
 
-    # Track the *previous* tick values so we can compute deltas
-    prev_tokens = 0
-    prev_cost = 0.0
+class _JobRunner:
+    """Lifecycle shared by enrichment and retry jobs.
 
-    def _cancel_check() -> None:
-        """Raise CancelledError if the cancel event is set."""
-        if cancel_event.is_set():
+    Registers the cancel event, seeds and publishes live state, turns
+    progress callbacks into live/persisted updates, and finalises the job
+    record once the wrapped task returns or raises.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        owner: str,
+        job_store: JobStoragePort,
+        initial_message: str,
+    ) -> None:
+        self.job_id = job_id
+        self.owner = owner
+        self._job_store = job_store
+        self._cancel_token = _CancelToken()
+        with _live_state_lock:
+            _cancel_events[job_id] = self._cancel_token
+
+        # Load persisted all-time AI usage as the baseline for live updates
+        baseline_usage = job_store.get_ai_usage(owner)
+
+        # Initialise live state
+        with _live_state_lock:
+            _prune_live_state(time.monotonic())
+            _owner_running_jobs[owner] = _owner_running_jobs.get(owner, 0) + 1
+            _owner_idle_since.pop(owner, None)
+            _job_live_state[job_id] = {
+                "id": job_id,
+                "status": JobStatus.RUNNING.value,
+                "total": 0,
+                "current": 0,
+                "message": initial_message,
+                "errors": [],
+                "ai_usage": {"input_tokens": 0, "output_tokens": 0, "cost": 0.0},
+            }
+
+            # Ensure live AI usage reflects the DB baseline (don't overwrite
+            # if another job already seeded it — it would be equal or larger).
+            if owner not in _ai_usage_live:
+                _ai_usage_live[owner] = baseline_usage.copy()
+
+        # Immutable, so every snapshot (live state, job record) can share it;
+        # it's only rebuilt when an error is actually recorded.
+        self._errors: tuple[dict, ...] = ()
+        # Same for the job's usage: replaced (never mutated) when it changes,
+        # so snapshots share it instead of copying it per tick.
+        self._ai_usage = {"input_tokens": 0, "output_tokens": 0, "cost": 0.0}
+
+        # Track the *previous* tick values so we can compute deltas
+        self._prev_tokens = 0
+        self._prev_cost = 0.0
+        self._usage_writer = _AiUsageWriter(job_store, owner)
+        self._progress_writer = _JobProgressWriter(job_store, job_id)
+
+    def cancel_check(self) -> None:
+        """Raise CancelledError once the job's cancel token is set."""
+        if self._cancel_token.cancelled:
             raise CancelledError("Job cancelled by user")
 
-    def _on_progress(progress: dict) -> None:
-        """Callback from enrichment.process_playlist."""
-        nonlocal job_ai_usage, prev_tokens, prev_cost
+    def on_progress(self, progress: dict) -> None:
+        """Progress callback for process_playlist / retry_failed_tracks.
 
+        Not thread-safe: callers must not invoke it concurrently (both
+        pipelines serialize their reports).
+        """
+        job_id, owner = self.job_id, self.owner
         current = progress.get("current", 0)
         total = progress.get("total", 0)
         message = progress.get("message", "")
@@ -130,124 +353,171 @@ def run_enrichment_job(
 
         # Record errors from individual tracks
         if track_data and track_data.get("error_message"):
-            error_entry = {
+            self._errors += ({
                 "track_title": track_data.get("title", ""),
                 "track_video_id": track_data.get("videoId", ""),
                 "message": track_data["error_message"],
-            }
-            job_errors.append(error_entry)
-
-        # Track AI usage delta for this tick
-        job_ai_usage = {"input_tokens": tokens, "output_tokens": 0, "cost": cost}
+            },)
 
         # Compute delta since last tick for additive live update
-        delta_tokens = tokens - prev_tokens
-        delta_cost = cost - prev_cost
-        prev_tokens = tokens
-        prev_cost = cost
-
-        # Update live state
-        with _live_state_lock:
-            _job_live_state[job_id] = {
-                "id": job_id,
-                "status": JobStatus.RUNNING.value,
-                "total": total,
-                "current": current,
-                "message": message,
-                "errors": job_errors.copy(),
-                "ai_usage": job_ai_usage.copy(),
-            }
+        delta_tokens = tokens - self._prev_tokens
+        delta_cost = cost - self._prev_cost
+        has_usage = delta_tokens != 0 or delta_cost != 0
+        if has_usage:
+            self._prev_tokens = tokens
+            self._prev_cost = cost
+            self._ai_usage = {"input_tokens": tokens, "output_tokens": 0, "cost": cost}
+
+        # Publish live state: fully built first, then one atomic store
+        _job_live_state[job_id] = {
+            "id": job_id,
+            "status": JobStatus.RUNNING.value,
+            "total": total,
+            "current": current,
+            "message": message,
+            "errors": self._errors,
+            "ai_usage": self._ai_usage,
+        }
 
-            # Additively update the shared live AI usage with this tick's delta.
-            # This is safe across concurrent jobs because each adds only its own delta.
-            current_live = _ai_usage_live.get(owner, {"input_tokens": 0, "output_tokens": 0, "cost": 0.0})
-            _ai_usage_live[owner] = {
-                "input_tokens": current_live["input_tokens"] + delta_tokens,
-                "output_tokens": current_live["output_tokens"],
-                "cost": current_live["cost"] + delta_cost,
-            }
+        # Additively update the shared live AI usage with this tick's delta.
+        # This is safe across concurrent jobs because each adds only its own delta.
+        # Zero-delta ticks (cache hits, non-AI steps) leave it untouched.
+        if has_usage:
+            with _live_state_lock:
+                current_live = _ai_usage_live.get(owner, {"input_tokens": 0, "output_tokens": 0, "cost": 0.0})
+                _ai_usage_live[owner] = {
+                    "input_tokens": current_live["input_tokens"] + delta_tokens,
+                    "output_tokens": current_live["output_tokens"],
+                    "cost": current_live["cost"] + delta_cost,
+                }
+            _notify_ai_usage(owner)
+        _notify_job(job_id)
 
         # Persist AI usage deltas to the shared ai_usage collection
-        # on every track so the SSE stream picks up changes across
-        # Cloud Run instances (SSE may route to a different instance).
-        if delta_tokens > 0 or delta_cost > 0:
-            try:
-                updated = job_store.update_ai_usage(
-                    owner, delta_tokens, 0, delta_cost,
-                )
-                with _live_state_lock:
-                    _ai_usage_live[owner] = updated
-            except Exception:
-                pass  # Best-effort — final update at job end is the source of truth
-
-        # Persist job progress periodically (every 5 tracks or on first/last)
-        if current == 0 or current == total or current % 5 == 0:
-            job_store.update_job(job_id, {
-                "status": JobStatus.RUNNING.value,
-                "total": total,
-                "current": current,
-                "message": message,
-                "errors": job_errors.copy(),
-                "ai_usage": job_ai_usage.copy(),
-            })
-
-    try:
-        logger.info(
-            "job_started",
-            job_id=job_id,
-            playlist_id=playlist_id,
-            owner=owner,
-        )
-        job_store.update_job(job_id, {"status": JobStatus.RUNNING.value})
+        # (batched, about once a second) so the SSE stream picks up changes
+        # across Cloud Run instances (SSE may route to a different instance).
+        if has_usage:
+            self._usage_writer.add(delta_tokens, delta_cost)
 
-        enrichment.process_playlist(
-            playlist_id=playlist_id,
-            owner=owner,
-            wipe=wipe,
-            api_key=api_key,
-            on_progress=_on_progress,
-            cancel_check=_cancel_check,
-            playlist_fetcher=playlist_fetcher,
-        )
+        # Persist job progress (combined between flushes; first/last immediately)
+        self._progress_writer.add({
+            "status": JobStatus.RUNNING.value,
+            "total": total,
+            "current": current,
+            "message": message,
+            "errors": self._errors,
+            "ai_usage": self._ai_usage,
+        }, force=current == 0 or current == total)
+
+    def run(
+        self,
+        task: Callable[[], object],
+        *,
+        done_message: str,
+        log_prefix: str,
+        **log_fields: object,
+    ) -> None:
+        """Run ``task`` and finalise the job with its outcome.
+
+        Logs ``<log_prefix>_started`` / ``_cancelled`` / ``_failed`` events.
+        """
+        job_id = self.job_id
+        try:
+            logger.info(
+                f"{log_prefix}_started", job_id=job_id, owner=self.owner, **log_fields,
+            )
+            self._job_store.update_job(job_id, {"status": JobStatus.RUNNING.value})
 
-        final_status = JobStatus.COMPLETED.value
-        final_message = "Enrichment complete"
+            task()
 
-    except CancelledError:
-        logger.info("job_cancelled", job_id=job_id)
-        final_status = JobStatus.CANCELLED.value
-        final_message = "Cancelled by user"
+            final_status = JobStatus.COMPLETED.value
+            final_message = done_message
 
-    except Exception as e:
-        logger.error("job_failed", job_id=job_id, error=str(e))
-        final_status = JobStatus.ERROR.value
-        final_message = str(e)
-        job_errors.append({"track_title": "", "track_video_id": "", "message": str(e)})
+        except CancelledError:
+            logger.info(f"{log_prefix}_cancelled", job_id=job_id)
+            final_status = JobStatus.CANCELLED.value
+            final_message = "Cancelled by user"
 
-    # --- Finalise ---
+        except Exception as e:
+            logger.error(f"{log_prefix}_failed", job_id=job_id, error=str(e))
+            final_status = JobStatus.ERROR.value
+            final_message = str(e)
+            self._errors += ({"track_title": "", "track_video_id": "", "message": str(e)},)
 
-    with _live_state_lock:
+        self._finalise(final_status, final_message)
+
+    def _finalise(self, final_status: str, final_message: str) -> None:
+        job_id = self.job_id
         _job_live_state[job_id] = {
             **_job_live_state.get(job_id, {}),
             "status": final_status,
             "message": final_message,
-            "errors": job_errors.copy(),
-            "ai_usage": job_ai_usage.copy(),
+            "errors": self._errors,
+            "ai_usage": self._ai_usage,
         }
+        _notify_job(job_id)
+
+        # Final record, combined with any progress still pending
+        self._progress_writer.flush(
+            status=final_status,
+            message=final_message,
+            errors=self._errors,
+            ai_usage=self._ai_usage,
+        )
 
-    job_store.update_job(job_id, {
-        "status": final_status,
-        "message": final_message,
-        "errors": job_errors,
-        "ai_usage": job_ai_usage,
-    })
+        # AI usage is persisted incrementally in on_progress; write only the
+        # deltas still pending (not the job total — that would double-count).
+        self._usage_writer.flush()
 
-    # AI usage is already persisted incrementally per-track in _on_progress.
-    # No final update_ai_usage call needed — it would double-count tokens.
+        # Cleanup in-memory cancel token; schedule live state for eviction
+        with _live_state_lock:
+            _cancel_events.pop(job_id, None)
+            now = time.monotonic()
+            _job_finished_at[job_id] = now
+            running = _owner_running_jobs.pop(self.owner, 1) - 1
+            if running > 0:
+                _owner_running_jobs[self.owner] = running
+            else:
+                _owner_idle_since[self.owner] = now
+            _prune_live_state(now)
 
-    # Cleanup in-memory cancel event
-    with _live_state_lock:
-        _cancel_events.pop(job_id, None)
+
+def run_enrichment_job(
+    job_id: str,
+    playlist_id: str,
+    owner: str,
+    api_key: str,
+    wipe: bool = False,
+    job_store: JobStoragePort | None = None,
+    playlist_fetcher=None,
+) -> None:
+    """Run the enrichment process as a background job.
+
+    Updates the Job record on each progress tick and on
+    completion/error/cancellation.
+
+    Args:
+        job_store: Optional JobStoragePort adapter. Falls back to factory
+            default when not provided (production default).
+    """
+    if job_store is None:
+        job_store = get_jobs_storage()
+
+    runner = _JobRunner(job_id, owner, job_store, initial_message="Initializing…")
+    runner.run(
+        lambda: enrichment.process_playlist(
+            playlist_id=playlist_id,
+            owner=owner,
+            wipe=wipe,
+            api_key=api_key,
+            on_progress=runner.on_progress,
+            cancel_check=runner.cancel_check,
+            playlist_fetcher=playlist_fetcher,
+        ),
+        done_message="Enrichment complete",
+        log_prefix="job",
+        playlist_id=playlist_id,
+    )
 
 
 def run_retry_job(
@@ -265,141 +535,16 @@ def run_retry_job(
     if job_store is None:
         job_store = get_jobs_storage()
 
-    cancel_event = threading.Event()
-    with _live_state_lock:
-        _cancel_events[job_id] = cancel_event
-
-    baseline_usage = job_store.get_ai_usage(owner)
-
-    with _live_state_lock:
-        _job_live_state[job_id] = {
-            "id": job_id,
-            "status": JobStatus.RUNNING.value,
-            "total": 0,
-            "current": 0,
-            "message": "Initializing retry…",
-            "errors": [],
-            "ai_usage": {"input_tokens": 0, "output_tokens": 0, "cost": 0.0},
-        }
-        if owner not in _ai_usage_live:
-            _ai_usage_live[owner] = baseline_usage.copy()
-
-    job_errors: list[dict] = []
-    job_ai_usage = {"input_tokens": 0, "output_tokens": 0, "cost": 0.0}
-    prev_tokens = 0
-    prev_cost = 0.0
-
-    def _cancel_check() -> None:
-        if cancel_event.is_set():
-            raise CancelledError("Job cancelled by user")
-
-    def _on_progress(progress: dict) -> None:
-        nonlocal job_ai_usage, prev_tokens, prev_cost
-
-        current = progress.get("current", 0)
-        total = progress.get("total", 0)
-        message = progress.get("message", "")
-        tokens = progress.get("tokens", 0)
-        cost = progress.get("cost", 0.0)
-        track_data = progress.get("track_data")
-
-        if track_data and track_data.get("error_message"):
-            job_errors.append({
-                "track_title": track_data.get("title", ""),
-                "track_video_id": track_data.get("videoId", ""),
-                "message": track_data["error_message"],
-            })
-
-        job_ai_usage = {"input_tokens": tokens, "output_tokens": 0, "cost": cost}
-
-        delta_tokens = tokens - prev_tokens
-        delta_cost = cost - prev_cost
-        prev_tokens = tokens
-        prev_cost = cost
-
-        with _live_state_lock:
-            _job_live_state[job_id] = {
-                "id": job_id,
-                "status": JobStatus.RUNNING.value,
-                "total": total,
-                "current": current,
-                "message": message,
-                "errors": job_errors.copy(),
-                "ai_usage": job_ai_usage.copy(),
-            }
-
-            current_live = _ai_usage_live.get(
-                owner, {"input_tokens": 0, "output_tokens": 0, "cost": 0.0}
-            )
-            _ai_usage_live[owner] = {
-                "input_tokens": current_live["input_tokens"] + delta_tokens,
-                "output_tokens": current_live["output_tokens"],
-                "cost": current_live["cost"] + delta_cost,
-            }
-
-        if current == 0 or current == total or current % 5 == 0:
-            job_store.update_job(job_id, {
-                "status": JobStatus.RUNNING.value,
-                "total": total,
-                "current": current,
-                "message": message,
-                "errors": job_errors.copy(),
-                "ai_usage": job_ai_usage.copy(),
-            })
-
-    try:
-        logger.info("retry_job_started", job_id=job_id, owner=owner)
-        job_store.update_job(job_id, {"status": JobStatus.RUNNING.value})
-
-        enrichment.retry_failed_tracks(
+    runner = _JobRunner(job_id, owner, job_store, initial_message="Initializing retry…")
+    runner.run(
+        lambda: enrichment.retry_failed_tracks(
             owner=owner,
             api_key=api_key,
-            on_progress=_on_progress,
-            cancel_check=_cancel_check,
+            on_progress=runner.on_progress,
+            cancel_check=runner.cancel_check,
             video_ids=video_ids,
             storage_port=get_songs_storage(),
-        )
-
-        final_status = JobStatus.COMPLETED.value
-        final_message = "Retry complete"
-
-    except CancelledError:
-        logger.info("retry_job_cancelled", job_id=job_id)
-        final_status = JobStatus.CANCELLED.value
-        final_message = "Cancelled by user"
-
-    except Exception as e:
-        logger.error("retry_job_failed", job_id=job_id, error=str(e))
-        final_status = JobStatus.ERROR.value
-        final_message = str(e)
-        job_errors.append({"track_title": "", "track_video_id": "", "message": str(e)})
-
-    # --- Finalise ---
-    with _live_state_lock:
-        _job_live_state[job_id] = {
-            **_job_live_state.get(job_id, {}),
-            "status": final_status,
-            "message": final_message,
-            "errors": job_errors.copy(),
-            "ai_usage": job_ai_usage.copy(),
-        }
-
-    job_store.update_job(job_id, {
-        "status": final_status,
-        "message": final_message,
-        "errors": job_errors,
-        "ai_usage": job_ai_usage,
-    })
-
-    try:
-        tokens_in = job_ai_usage.get("input_tokens", 0)
-        cost_total = job_ai_usage.get("cost", 0.0)
-        if tokens_in > 0 or cost_total > 0:
-            updated = job_store.update_ai_usage(owner, tokens_in, 0, cost_total)
-            with _live_state_lock:
-                _ai_usage_live[owner] = updated
-    except Exception as e:
-        logger.error("ai_usage_update_failed", job_id=job_id, error=str(e))
-
-    with _live_state_lock:
-        _cancel_events.pop(job_id, None)
+        ),
+        done_message="Retry complete",
+        log_prefix="retry_job",
+    )
@@ -25,6 +25,9 @@ class JobType(str, Enum):
 
 TERMINAL_STATUSES = frozenset({JobStatus.COMPLETED, JobStatus.ERROR, JobStatus.CANCELLED})
 
+# String values of TERMINAL_STATUSES, for checking raw ``status`` fields
+TERMINAL_STATUS_VALUES: frozenset[str] = frozenset(s.value for s in TERMINAL_STATUSES)
+
 
 # --- Request / Response schemas ---
 
@@ -4,10 +4,11 @@ Prefix: ``/jobs``
 """
 
 import asyncio
-import json
 import os
+import time
 from typing import Optional
 
+import orjson
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
@@ -21,7 +22,7 @@ from song_shake.features.jobs.models import (
     JobResponse,
     JobStatus,
     JobType,
-    TERMINAL_STATUSES,
+    TERMINAL_STATUS_VALUES,
 )
 from song_shake.platform.protocols import JobStoragePort
 from song_shake.platform.storage_factory import get_jobs_storage
@@ -31,6 +32,46 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
+# SSE payloads keep json.dumps(default=str) output for datetimes/int keys.
+_SSE_JSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+# Seconds an idle job stream waits for an update before a keep-alive comment.
+_STREAM_HEARTBEAT = 15.0
+
+# Seconds between AI usage stream re-reads of the persisted totals, which
+# pick up usage from jobs running on other instances.
+_AI_USAGE_RECONCILE = 5.0
+
+
+def _sse_frame(payload: dict) -> bytes:
+    """Encode a payload as a complete SSE ``data:`` frame.
+
+    Frames stay bytes end to end: orjson writes UTF-8 without escaping
+    non-ASCII titles, and StreamingResponse sends bytes as-is.
+    """
+    return b"data: " + orjson.dumps(payload, default=str, option=_SSE_JSON_OPTIONS) + b"\n\n"
+
+
+# Latest encoded frame per streamed job: job_id → (live state, frame).
+# Live state is republished as a new dict on every update, so every SSE
+# client of a job reuses one encoding per update instead of each
+# re-encoding it. Dropped once the job's last stream ends.
+# Only touched from the event loop.
+_job_frames: dict[str, tuple[dict, bytes]] = {}
+# Open SSE streams per job: job_id → count
+_job_frame_streams: dict[str, int] = {}
+
+
+def _job_frame(job_id: str, state: dict) -> bytes:
+    """Return the SSE frame for a job's live state, encoding it once."""
+    cached = _job_frames.get(job_id)
+    if cached is not None and cached[0] is state:
+        return cached[1]
+    frame = _sse_frame(state)
+    _job_frames[job_id] = (state, frame)
+    return frame
+
 
 # ---------------------------------------------------------------------------
 # POST /jobs  — create a new enrichment job
@@ -107,6 +148,16 @@ def create_job(
 # ---------------------------------------------------------------------------
 
 
+def _with_live_state(jobs: list[dict]) -> list[dict]:
+    """Overlay each running job's in-memory live state onto its DB record."""
+    get_live_state = logic.get_live_state  # Lock-free lookup, one per job
+    for j in jobs:
+        live = get_live_state(j["id"])
+        if live:
+            j.update(live)
+    return jobs
+
+
 @router.get("")
 def list_jobs(
     user: dict = Depends(get_current_user),
@@ -115,21 +166,11 @@ def list_jobs(
 ):
     owner = user["sub"]
     if status == "active":
-        jobs = job_store.get_active_jobs(owner)
-        # Enrich with live state
-        for j in jobs:
-            live = logic.get_live_state(j["id"])
-            if live:
-                j.update(live)
-        return jobs
+        return _with_live_state(job_store.get_active_jobs(owner))
     if status == "history":
         return job_store.get_job_history(owner)
     # Default: return all active + recent history
-    active = job_store.get_active_jobs(owner)
-    for j in active:
-        live = logic.get_live_state(j["id"])
-        if live:
-            j.update(live)
+    active = _with_live_state(job_store.get_active_jobs(owner))
     history = job_store.get_job_history(owner)
     return {"active": active, "history": history[:20]}
 
@@ -250,30 +291,45 @@ async def stream_ai_usage(
     owner = user["sub"]
 
     async def event_generator():
-        last_hash = ""
-        while True:
-            # Always read from database — on Cloud Run with multiple
-            # instances, the SSE connection may be routed to a different
-            # instance than the one running the background job, so the
-            # in-memory _ai_usage_live dict may be stale.
-            live = await asyncio.to_thread(logic.get_live_ai_usage, owner)
-            db_usage = await asyncio.to_thread(job_store.get_ai_usage, owner)
-
-            # Use whichever has more tokens (live may be ahead of DB
-            # if this happens to be the same instance as the job)
-            live_tokens = (live or {}).get("input_tokens", 0)
-            db_tokens = db_usage.get("input_tokens", 0)
-            usage = live if live_tokens > db_tokens else db_usage
-
-            data = json.dumps(usage, default=str)
-            current_hash = data
-
-            # Only send if changed
-            if current_hash != last_hash:
-                yield f"data: {data}\n\n"
-                last_hash = current_hash
-
-            await asyncio.sleep(1.0)
+        # Woken by this instance's jobs whenever the live usage changes
+        changed = logic.subscribe_ai_usage(owner)
+        last_usage = None
+        db_usage = None
+        last_sent = time.monotonic()
+        try:
+            while True:
+                # Clear before reading so an update racing the read re-wakes us
+                changed.clear()
+                # Re-read the database on every reconcile timeout — on Cloud
+                # Run with multiple instances, the job may be running on a
+                # different instance than this SSE connection, so the
+                # in-memory _ai_usage_live dict may be stale.
+                if db_usage is None:
+                    db_usage = await asyncio.to_thread(job_store.get_ai_usage, owner)
+                live = logic.get_live_ai_usage(owner)  # Lock-free snapshot read
+
+                # Use whichever has more tokens (live may be ahead of DB
+                # if this happens to be the same instance as the job)
+                live_tokens = (live or {}).get("input_tokens", 0)
+                db_tokens = db_usage.get("input_tokens", 0)
+                usage = live if live_tokens > db_tokens else db_usage
+
+                # Only encode and send if changed (compares three counters)
+                if usage != last_usage:
+                    yield _sse_frame(usage)
+                    last_usage = usage
+                    last_sent = time.monotonic()
+                elif time.monotonic() - last_sent >= _STREAM_HEARTBEAT:
+                    # SSE comment keeps idle connections open through proxies
+                    yield b": keep-alive\n\n"
+                    last_sent = time.monotonic()
+
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=_AI_USAGE_RECONCILE)
+                except TimeoutError:
+                    db_usage = None
+        finally:
+            logic.unsubscribe_ai_usage(owner, changed)
 
     return StreamingResponse(
         event_generator(),
@@ -319,19 +375,19 @@ def cancel_job(
     user: dict = Depends(get_current_user),
     job_store: JobStoragePort = Depends(get_jobs_storage),
 ):
-    event = logic.get_cancel_event(job_id)
-    if event:
+    token = logic.get_cancel_token(job_id)
+    if token:
         # Normal case: job is running in-memory, signal cancellation
-        event.set()
+        token.cancelled = True
         logger.info("job_cancel_requested", job_id=job_id)
         return {"message": "Cancellation requested", "job_id": job_id}
 
-    # No in-memory cancel event — check DB
+    # No in-memory cancel token — check DB
     job = job_store.get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    if job.get("status") in [s.value for s in TERMINAL_STATUSES]:
+    if job.get("status") in TERMINAL_STATUS_VALUES:
         raise HTTPException(status_code=409, detail="Job already finished")
 
     # Zombie job: still "running"/"pending" in DB but has no in-memory
@@ -356,28 +412,55 @@ async def stream_job(
     job_store: JobStoragePort = Depends(get_jobs_storage),
 ):
     # Must exist in live state or DB
-    live = await asyncio.to_thread(logic.get_live_state, job_id)
+    live = logic.get_live_state(job_id)
     persisted = await asyncio.to_thread(job_store.get_job, job_id) if not live else None
 
     if not live and not persisted:
         raise HTTPException(status_code=404, detail="Job not found")
 
     async def event_generator():
-        while True:
-            state = await asyncio.to_thread(logic.get_live_state, job_id)
-            if not state:
-                # Job may have finished and been cleaned from memory
-                db_state = await asyncio.to_thread(job_store.get_job, job_id)
-                if db_state:
-                    # Send final state and close
-                    yield f"data: {json.dumps(db_state, default=str)}\n\n"
-                break
-
-            yield f"data: {json.dumps(state, default=str)}\n\n"
-
-            if state.get("status") in [s.value for s in TERMINAL_STATUSES]:
-                break
-
-            await asyncio.sleep(0.5)
+        # Woken by the job's progress callback instead of polling
+        changed = logic.subscribe_job(job_id)
+        _job_frame_streams[job_id] = _job_frame_streams.get(job_id, 0) + 1
+        last_state = None
+        last_frame = b""
+        try:
+            while True:
+                # Clear before reading so an update racing the read re-wakes us
+                changed.clear()
+                state = logic.get_live_state(job_id)
+                if not state:
+                    # Job may have finished and been cleaned from memory
+                    db_state = await asyncio.to_thread(job_store.get_job, job_id)
+                    if db_state:
+                        # Send final state and close
+                        yield _sse_frame(db_state)
+                    break
+
+                # Only send if changed — the job's errors list grows with it.
+                # Live state is republished as a new dict on every update, so
+                # the same object means nothing changed and needs no re-encoding.
+                if state is not last_state:
+                    frame = _job_frame(job_id, state)
+                    if frame != last_frame:
+                        yield frame
+                        last_frame = frame
+                    last_state = state
+
+                if state.get("status") in TERMINAL_STATUS_VALUES:
+                    break
+
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=_STREAM_HEARTBEAT)
+                except TimeoutError:
+                    # SSE comment keeps idle connections open through proxies
+                    yield b": keep-alive\n\n"
+        finally:
+            logic.unsubscribe_job(job_id, changed)
+            streams = _job_frame_streams.pop(job_id, 1) - 1
+            if streams > 0:
+                _job_frame_streams[job_id] = streams
+            else:
+                _job_frames.pop(job_id, None)
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
@@ -1,11 +1,14 @@
 """TinyDB storage operations for jobs and all-time AI usage."""
 
 import threading
+import time
 from datetime import datetime, timezone
 
 from tinydb import TinyDB, Query
+from tinydb.table import Table
 
-from song_shake.features.jobs.models import JobStatus, JobType, TERMINAL_STATUSES
+from song_shake.features.jobs.models import JobStatus, JobType, TERMINAL_STATUS_VALUES
+from song_shake.features.songs.storage import OrjsonStorage
 
 STORAGE_FILE = "songs.db"
 
@@ -13,11 +16,27 @@ STORAGE_FILE = "songs.db"
 # against concurrent access from multiple background threads.
 _db_lock = threading.Lock()
 
+# Shared TinyDB instance for STORAGE_FILE, opened once instead of per call
+# (each call used to open, and never close, a new file handle).
+_db_instance: TinyDB | None = None
+_db_instance_path: str | None = None
+
 
 def _db(db: TinyDB | None = None) -> TinyDB:
+    """Return ``db`` or the shared instance. Call with ``_db_lock`` held."""
+    global _db_instance, _db_instance_path
     if db is not None:
         return db
-    return TinyDB(STORAGE_FILE)
+    if _db_instance is None or _db_instance_path != STORAGE_FILE:
+        _db_instance = TinyDB(STORAGE_FILE, storage=OrjsonStorage)
+        _db_instance_path = STORAGE_FILE
+    return _db_instance
+
+
+def _table(database: TinyDB, name: str) -> Table:
+    # No query cache: callers mutate returned records (e.g. overlaying live
+    # state), which would otherwise leak into later cached search results.
+    return database.table(name, cache_size=0)
 
 
 # ---------------------------------------------------------------------------
@@ -25,6 +44,31 @@ def _db(db: TinyDB | None = None) -> TinyDB:
 # ---------------------------------------------------------------------------
 
 
+def _new_job_record(
+    job_id: str,
+    job_type: JobType,
+    playlist_id: str,
+    owner: str,
+    playlist_name: str,
+) -> dict:
+    now = datetime.now(timezone.utc).isoformat()
+    return {
+        "id": job_id,
+        "type": job_type.value,
+        "playlist_id": playlist_id,
+        "playlist_name": playlist_name,
+        "owner": owner,
+        "status": JobStatus.PENDING.value,
+        "total": 0,
+        "current": 0,
+        "message": "Initializing…",
+        "errors": [],
+        "ai_usage": {"input_tokens": 0, "output_tokens": 0, "cost": 0.0},
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
 def create_job(
     job_id: str,
     job_type: JobType,
@@ -34,24 +78,9 @@ def create_job(
     db: TinyDB | None = None,
 ) -> dict:
     """Insert a new job record and return it."""
+    record = _new_job_record(job_id, job_type, playlist_id, owner, playlist_name)
     with _db_lock:
-        now = datetime.now(timezone.utc).isoformat()
-        record = {
-            "id": job_id,
-            "type": job_type.value,
-            "playlist_id": playlist_id,
-            "playlist_name": playlist_name,
-            "owner": owner,
-            "status": JobStatus.PENDING.value,
-            "total": 0,
-            "current": 0,
-            "message": "Initializing…",
-            "errors": [],
-            "ai_usage": {"input_tokens": 0, "output_tokens": 0, "cost": 0.0},
-            "created_at": now,
-            "updated_at": now,
-        }
-        _db(db).table("jobs").insert(record)
+        _table(_db(db), "jobs").insert(record)
         return record
 
 
@@ -60,14 +89,14 @@ def update_job(job_id: str, fields: dict, db: TinyDB | None = None) -> None:
     with _db_lock:
         fields["updated_at"] = datetime.now(timezone.utc).isoformat()
         Job = Query()
-        _db(db).table("jobs").update(fields, Job.id == job_id)
+        _table(_db(db), "jobs").update(fields, Job.id == job_id)
 
 
 def get_job(job_id: str, db: TinyDB | None = None) -> dict | None:
     """Retrieve a single job by id."""
     with _db_lock:
         Job = Query()
-        results = _db(db).table("jobs").search(Job.id == job_id)
+        results = _table(_db(db), "jobs").search(Job.id == job_id)
         return results[0] if results else None
 
 
@@ -80,18 +109,17 @@ def get_active_jobs(owner: str | None = None, db: TinyDB | None = None) -> list[
         )
         if owner:
             cond = cond & (Job.owner == owner)
-        return _db(db).table("jobs").search(cond)
+        return _table(_db(db), "jobs").search(cond)
 
 
 def get_job_history(owner: str | None = None, db: TinyDB | None = None) -> list[dict]:
     """Return completed/error/cancelled jobs, optionally filtered by owner."""
     with _db_lock:
         Job = Query()
-        terminal_values = [s.value for s in TERMINAL_STATUSES]
-        cond = Job.status.one_of(terminal_values)
+        cond = Job.status.one_of(TERMINAL_STATUS_VALUES)
         if owner:
             cond = cond & (Job.owner == owner)
-        results = _db(db).table("jobs").search(cond)
+        results = _table(_db(db), "jobs").search(cond)
         # Most recent first
         results.sort(key=lambda j: j.get("updated_at", ""), reverse=True)
         return results
@@ -112,7 +140,7 @@ def get_job_for_playlist(
         )
         if owner:
             cond = cond & (Job.owner == owner)
-        results = _db(db).table("jobs").search(cond)
+        results = _table(_db(db), "jobs").search(cond)
         return results[0] if results else None
 
 
@@ -129,38 +157,22 @@ def check_and_create_job(
     Returns the new job record, or None if an active job already exists.
     This prevents the TOCTOU race between get_job_for_playlist + create_job.
     """
-    with _db_lock:
-        database = _db(db)
-        Job = Query()
-        cond = (
-            (Job.playlist_id == playlist_id)
-            & (
-                (Job.status == JobStatus.PENDING.value)
-                | (Job.status == JobStatus.RUNNING.value)
-            )
-            & (Job.owner == owner)
+    Job = Query()
+    cond = (
+        (Job.playlist_id == playlist_id)
+        & (
+            (Job.status == JobStatus.PENDING.value)
+            | (Job.status == JobStatus.RUNNING.value)
         )
-        existing = database.table("jobs").search(cond)
-        if existing:
+        & (Job.owner == owner)
+    )
+    record = _new_job_record(job_id, job_type, playlist_id, owner, playlist_name)
+    with _db_lock:
+        jobs = _table(_db(db), "jobs")
+        # contains() stops at the first match instead of collecting all
+        if jobs.contains(cond):
             return None
-
-        now = datetime.now(timezone.utc).isoformat()
-        record = {
-            "id": job_id,
-            "type": job_type.value,
-            "playlist_id": playlist_id,
-            "playlist_name": playlist_name,
-            "owner": owner,
-            "status": JobStatus.PENDING.value,
-            "total": 0,
-            "current": 0,
-            "message": "Initializing…",
-            "errors": [],
-            "ai_usage": {"input_tokens": 0, "output_tokens": 0, "cost": 0.0},
-            "created_at": now,
-            "updated_at": now,
-        }
-        database.table("jobs").insert(record)
+        jobs.insert(record)
         return record
 
 
@@ -181,15 +193,41 @@ def get_all_active_jobs(db: TinyDB | None = None) -> dict:
 # ---------------------------------------------------------------------------
 
 
+# Short-lived per-owner cache of the default database's AI usage records,
+# so dashboards and SSE streams don't re-read the whole file each poll.
+# update_ai_usage refreshes an owner's entry after every write, so the TTL
+# only bounds staleness against changes made outside this process.
+# Key: owner → (expires_at monotonic timestamp, record)
+AI_USAGE_CACHE_TTL = 2.0
+_ai_usage_cache: dict[str, tuple[float, dict]] = {}
+
+
+def _cache_ai_usage(owner: str, record: dict) -> None:
+    if AI_USAGE_CACHE_TTL > 0:
+        _ai_usage_cache[owner] = (time.monotonic() + AI_USAGE_CACHE_TTL, dict(record))
+
+
 def get_ai_usage(owner: str, db: TinyDB | None = None) -> dict:
-    """Return all-time AI usage for an owner. Creates record if missing."""
+    """Return all-time AI usage for an owner. Creates record if missing.
+
+    Reads of the default database are served from a cache for up to
+    AI_USAGE_CACHE_TTL seconds.
+    """
+    if db is None:
+        entry = _ai_usage_cache.get(owner)
+        if entry is not None and entry[0] > time.monotonic():
+            return dict(entry[1])
+
     with _db_lock:
         Usage = Query()
-        results = _db(db).table("ai_usage").search(Usage.owner == owner)
+        results = _table(_db(db), "ai_usage").search(Usage.owner == owner)
         if results:
-            return results[0]
-        record = {"owner": owner, "input_tokens": 0, "output_tokens": 0, "cost": 0.0}
-        _db(db).table("ai_usage").insert(record)
+            record = results[0]
+        else:
+            record = {"owner": owner, "input_tokens": 0, "output_tokens": 0, "cost": 0.0}
+            _table(_db(db), "ai_usage").insert(record)
+        if db is None:
+            _cache_ai_usage(owner, record)
         return record
 
 
@@ -208,7 +246,7 @@ def update_ai_usage(
     with _db_lock:
         database = _db(db)
         Usage = Query()
-        table = database.table("ai_usage")
+        table = _table(database, "ai_usage")
         results = table.search(Usage.owner == owner)
 
         if results:
@@ -220,13 +258,17 @@ def update_ai_usage(
             }
             table.update(updated, Usage.owner == owner)
             current.update(updated)
-            return current
-
-        record = {
-            "owner": owner,
-            "input_tokens": input_tokens_delta,
-            "output_tokens": output_tokens_delta,
-            "cost": cost_delta,
-        }
-        table.insert(record)
+            record = current
+        else:
+            record = {
+                "owner": owner,
+                "input_tokens": input_tokens_delta,
+                "output_tokens": output_tokens_delta,
+                "cost": cost_delta,
+            }
+            table.insert(record)
+
+        # Refresh after the write, so cached reads see the new totals
+        if db is None:
+            _cache_ai_usage(owner, record)
         return record
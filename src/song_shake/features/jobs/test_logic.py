@@ -0,0 +1,270 @@
+"""Unit tests for background job helpers."""
+
+import asyncio
+import threading
+
+import pytest
+
+from song_shake.features.jobs import logic
+
+
+class FakeJobStore:
+    """Records update_job / update_ai_usage calls and returns running totals."""
+
+    def __init__(self):
+        self.usage_calls: list[tuple[str, int, float]] = []
+        self.job_updates: list[dict] = []
+        self._totals = {"input_tokens": 0, "output_tokens": 0, "cost": 0.0}
+
+    def get_ai_usage(self, owner):
+        return dict(self._totals)
+
+    def update_job(self, job_id, fields):
+        self.job_updates.append(dict(fields))
+
+    def update_ai_usage(self, owner, input_tokens_delta, output_tokens_delta, cost_delta):
+        self.usage_calls.append((owner, input_tokens_delta, cost_delta))
+        self._totals = {
+            "input_tokens": self._totals["input_tokens"] + input_tokens_delta,
+            "output_tokens": self._totals["output_tokens"] + output_tokens_delta,
+            "cost": self._totals["cost"] + cost_delta,
+        }
+        return self._totals
+
+
+_LIVE_DICTS = (
+    logic._ai_usage_live,
+    logic._job_live_state,
+    logic._cancel_events,
+    logic._job_finished_at,
+    logic._owner_running_jobs,
+    logic._owner_idle_since,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_live_state():
+    for live in _LIVE_DICTS:
+        live.clear()
+    yield
+    for live in _LIVE_DICTS:
+        live.clear()
+
+
+class TestAiUsageWriter:
+    """Tests for _AiUsageWriter batching."""
+
+    def test_deltas_batched_until_flush(self, monkeypatch):
+        """Ticks within the interval accumulate into one write on flush."""
+        monkeypatch.setattr(logic, "AI_USAGE_FLUSH_INTERVAL", 3600)
+        store = FakeJobStore()
+        writer = logic._AiUsageWriter(store, "user")
+
+        writer.add(100, 0.01)
+        writer.add(50, 0.02)
+        assert store.usage_calls == []
+
+        writer.flush()
+
+        assert store.usage_calls == [("user", 150, pytest.approx(0.03))]
+        assert logic.get_live_ai_usage("user")["input_tokens"] == 150
+
+    def test_writes_through_once_interval_elapsed(self, monkeypatch):
+        """With no interval every tick is persisted immediately."""
+        monkeypatch.setattr(logic, "AI_USAGE_FLUSH_INTERVAL", 0)
+        store = FakeJobStore()
+        writer = logic._AiUsageWriter(store, "user")
+
+        writer.add(10, 0.1)
+        writer.add(20, 0.2)
+
+        assert [c[1] for c in store.usage_calls] == [10, 20]
+
+    def test_flush_keeps_other_jobs_unflushed_live_usage(self, monkeypatch):
+        """Persisted totals must not move the live counter backwards."""
+        monkeypatch.setattr(logic, "AI_USAGE_FLUSH_INTERVAL", 3600)
+        store = FakeJobStore()
+        # Live already counts this job's 10 tokens and another job's 50
+        # tokens that the other job hasn't flushed yet.
+        logic._ai_usage_live["user"] = {"input_tokens": 60, "output_tokens": 0, "cost": 0.6}
+        writer = logic._AiUsageWriter(store, "user")
+        writer.add(10, 0.1)
+
+        writer.flush()
+
+        assert logic.get_live_ai_usage("user")["input_tokens"] == 60
+
+    def test_flush_without_usage_skips_write(self):
+        """Nothing pending means no storage call."""
+        store = FakeJobStore()
+        logic._AiUsageWriter(store, "user").flush()
+        assert store.usage_calls == []
+
+
+class TestJobProgressWriter:
+    """Tests for _JobProgressWriter write-combining."""
+
+    def test_keeps_only_latest_pending_update(self, monkeypatch):
+        """Updates within the interval collapse into the newest one."""
+        monkeypatch.setattr(logic, "JOB_PROGRESS_FLUSH_INTERVAL", 3600)
+        store = FakeJobStore()
+        writer = logic._JobProgressWriter(store, "job_1")
+
+        writer.add({"current": 1, "total": 9})
+        writer.add({"current": 2, "total": 9})
+        assert store.job_updates == []
+
+        writer.flush(status="completed")
+
+        assert store.job_updates == [{"current": 2, "total": 9, "status": "completed"}]
+
+    def test_forced_update_written_immediately(self, monkeypatch):
+        """First/last progress bypasses the interval."""
+        monkeypatch.setattr(logic, "JOB_PROGRESS_FLUSH_INTERVAL", 3600)
+        store = FakeJobStore()
+        writer = logic._JobProgressWriter(store, "job_1")
+
+        writer.add({"current": 0}, force=True)
+        writer.flush()
+
+        assert store.job_updates == [{"current": 0}]
+
+
+class TestJobRunner:
+    """Tests for the shared job lifecycle."""
+
+    def test_completed_job_records_track_errors_and_usage(self):
+        """Progress errors and usage should land in the final job record."""
+        store = FakeJobStore()
+        runner = logic._JobRunner("job_1", "user", store, initial_message="Init")
+
+        def task():
+            runner.on_progress({"current": 1, "total": 2, "message": "m", "tokens": 10, "cost": 0.1})
+            runner.on_progress({
+                "current": 2, "total": 2, "message": "m", "tokens": 30, "cost": 0.3,
+                "track_data": {"title": "T", "videoId": "v2", "error_message": "boom"},
+            })
+
+        runner.run(task, done_message="Done", log_prefix="job")
+
+        final = store.job_updates[-1]
+        assert final["status"] == "completed"
+        assert final["message"] == "Done"
+        assert [e["track_video_id"] for e in final["errors"]] == ["v2"]
+        assert sum(c[1] for c in store.usage_calls) == 30
+        assert logic.get_live_state("job_1")["status"] == "completed"
+        assert "job_1" not in logic._cancel_events
+
+    def test_zero_delta_tick_leaves_usage_untouched(self, monkeypatch):
+        """A tick without new usage should not touch the shared AI usage."""
+        monkeypatch.setattr(logic, "AI_USAGE_FLUSH_INTERVAL", 0)
+        store = FakeJobStore()
+        runner = logic._JobRunner("job_1", "user", store, initial_message="Init")
+        runner.on_progress({"current": 1, "total": 3, "tokens": 10, "cost": 0.1})
+        usage = logic.get_live_ai_usage("user")
+
+        runner.on_progress({"current": 2, "total": 3, "tokens": 10, "cost": 0.1})
+
+        assert logic.get_live_ai_usage("user") is usage
+        assert len(store.usage_calls) == 1
+        assert logic.get_live_state("job_1")["current"] == 2
+
+    def test_cancelled_job(self):
+        """A set cancel token should end the job as cancelled."""
+        store = FakeJobStore()
+        runner = logic._JobRunner("job_2", "user", store, initial_message="Init")
+        logic.get_cancel_token("job_2").cancelled = True
+
+        runner.run(runner.cancel_check, done_message="Done", log_prefix="job")
+
+        assert store.job_updates[-1]["status"] == "cancelled"
+
+    def test_failed_task_appends_job_error(self):
+        """An exception from the task should fail the job and be recorded."""
+        store = FakeJobStore()
+        runner = logic._JobRunner("job_3", "user", store, initial_message="Init")
+
+        def task():
+            raise RuntimeError("playlist gone")
+
+        runner.run(task, done_message="Done", log_prefix="job")
+
+        final = store.job_updates[-1]
+        assert final["status"] == "error"
+        assert final["errors"][-1]["message"] == "playlist gone"
+
+
+class TestLiveStateEviction:
+    """Tests for bounding the in-memory live state."""
+
+    def test_finished_job_state_expires(self, monkeypatch):
+        """Finished jobs stay readable until the TTL, then are evicted."""
+        store = FakeJobStore()
+        logic._JobRunner("job_1", "user", store, initial_message="Init").run(
+            lambda: None, done_message="Done", log_prefix="job",
+        )
+        assert logic.get_live_state("job_1")["status"] == "completed"
+
+        monkeypatch.setattr(logic, "LIVE_STATE_TTL", 0)
+        logic._JobRunner("job_2", "user", store, initial_message="Init")
+
+        assert logic.get_live_state("job_1") is None
+        assert logic.get_live_state("job_2") is not None
+
+    def test_idle_owner_usage_expires_only_without_running_jobs(self, monkeypatch):
+        """An owner's live AI usage is kept while any of their jobs runs."""
+        monkeypatch.setattr(logic, "AI_USAGE_LIVE_TTL", 0)
+        store = FakeJobStore()
+        running = logic._JobRunner("job_1", "user", store, initial_message="Init")
+        logic._JobRunner("job_2", "user", store, initial_message="Init").run(
+            lambda: None, done_message="Done", log_prefix="job",
+        )
+        assert logic.get_live_ai_usage("user") is not None
+
+        running.run(lambda: None, done_message="Done", log_prefix="job")
+
+        assert logic.get_live_ai_usage("user") is None
+
+
+class TestJobListeners:
+    """Tests for the SSE wake-up registry."""
+
+    def test_notify_from_thread_wakes_subscriber(self):
+        """A progress update on a worker thread should set the stream's event."""
+
+        async def scenario():
+            event = logic.subscribe_job("job_1")
+            worker = threading.Thread(target=logic._notify_job, args=("job_1",))
+            worker.start()
+            await asyncio.wait_for(event.wait(), timeout=5)
+            worker.join()
+            logic.unsubscribe_job("job_1", event)
+
+        asyncio.run(scenario())
+
+        assert "job_1" not in logic._job_listeners
+
+    def test_notify_without_subscribers_is_noop(self):
+        """Notifying a job nobody streams should do nothing."""
+        logic._notify_job("nobody")
+        assert logic._job_listeners == {}
+
+    def test_usage_tick_wakes_ai_usage_subscriber(self):
+        """A progress tick with new AI usage should wake the owner's usage stream."""
+        store = FakeJobStore()
+
+        async def scenario():
+            event = logic.subscribe_ai_usage("user")
+            runner = logic._JobRunner("job_1", "user", store, initial_message="Init")
+            worker = threading.Thread(
+                target=runner.on_progress,
+                args=({"current": 1, "total": 2, "tokens": 10, "cost": 0.1},),
+            )
+            worker.start()
+            await asyncio.wait_for(event.wait(), timeout=5)
+            worker.join()
+            logic.unsubscribe_ai_usage("user", event)
+
+        asyncio.run(scenario())
+
+        assert logic._ai_usage_listeners == {}
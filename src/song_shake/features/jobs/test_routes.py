@@ -163,17 +163,16 @@ class TestCancelJob:
     """Tests for POST /jobs/{job_id}/cancel."""
 
     def test_cancels_running_job(self):
-        """Should set cancel event for active job."""
-        import threading
+        """Should set cancel token for active job."""
         from song_shake.features.jobs import logic
 
-        event = threading.Event()
-        logic._cancel_events["job_to_cancel"] = event
+        token = logic._CancelToken()
+        logic._cancel_events["job_to_cancel"] = token
 
         response = client.post("/api/jobs/job_to_cancel/cancel")
 
         assert response.status_code == 200
-        assert event.is_set()
+        assert token.cancelled
 
     @patch("song_shake.features.jobs.storage.get_job")
     def test_returns_404_for_unknown_job(self, mock_get_job):
@@ -263,3 +262,86 @@ class TestStreamJob:
         assert response.status_code == 200
         assert "text/event-stream" in response.headers["content-type"]
         assert "data:" in response.text
+
+    def test_skips_unchanged_state(self):
+        """Should not resend a state identical to the previous event."""
+        from song_shake.features.jobs import logic
+
+        running = {
+            "id": "job_run",
+            "status": "running",
+            "total": 2,
+            "current": 1,
+            "message": "Processing",
+            "errors": [],
+            "ai_usage": {"input_tokens": 0, "output_tokens": 0, "cost": 0.0},
+        }
+        # The route reads the state once to check the job exists, then polls
+        states = iter([running, running, running, {**running, "status": "completed"}])
+        logic._job_live_state["job_run"] = running
+
+        with patch(
+            "song_shake.features.jobs.routes.logic.get_live_state",
+            side_effect=lambda job_id: next(states),
+        ), patch("song_shake.features.jobs.routes._STREAM_HEARTBEAT", 0):
+            response = client.get("/api/jobs/job_run/stream")
+
+        assert response.text.count("data:") == 2
+
+
+class TestSseFrame:
+    """Tests for _sse_frame()."""
+
+    def test_encodes_utf8_without_escaping(self):
+        """Non-ASCII titles should be sent as raw UTF-8 in a complete frame."""
+        from datetime import datetime, timezone
+
+        from song_shake.features.jobs.routes import _sse_frame
+
+        frame = _sse_frame({
+            "message": "Café – 東京",
+            "created_at": datetime(2024, 1, 2, tzinfo=timezone.utc),
+        })
+
+        assert frame == (
+            'data: {"message":"Café – 東京","created_at":"2024-01-02 00:00:00+00:00"}\n\n'
+        ).encode()
+
+
+class TestJobFrame:
+    """Tests for _job_frame()."""
+
+    def test_encodes_each_state_once(self):
+        """Streams of the same job should share one encoding per update."""
+        from song_shake.features.jobs import routes
+
+        state = {"id": "job_1", "status": "running"}
+        try:
+            first = routes._job_frame("job_1", state)
+            assert routes._job_frame("job_1", state) is first
+
+            updated = {"id": "job_1", "status": "completed"}
+            assert b"completed" in routes._job_frame("job_1", updated)
+        finally:
+            routes._job_frames.clear()
+
+    def test_frame_kept_while_other_streams_open(self):
+        """A stream ending must not drop the frame other clients still share."""
+        from song_shake.features.jobs import logic, routes
+
+        logic._job_live_state["job_done"] = {"id": "job_done", "status": "completed"}
+        routes._job_frame_streams["job_done"] = 1  # Another client's stream
+        try:
+            client.get("/api/jobs/job_done/stream")
+
+            assert routes._job_frame_streams["job_done"] == 1
+            assert "job_done" in routes._job_frames
+
+            routes._job_frame_streams.clear()
+            client.get("/api/jobs/job_done/stream")
+
+            assert routes._job_frame_streams == {}
+            assert "job_done" not in routes._job_frames
+        finally:
+            routes._job_frames.clear()
+            routes._job_frame_streams.clear()
@@ -0,0 +1,100 @@
+"""Unit tests for jobs storage module."""
+
+import os
+import tempfile
+
+import pytest
+
+from song_shake.features.jobs import storage
+from song_shake.features.jobs.models import JobType
+
+
+def _close_shared_db():
+    """Close the shared TinyDB instance so the next _db() call reopens it."""
+    if storage._db_instance is not None:
+        storage._db_instance.close()
+    storage._db_instance = None
+    storage._db_instance_path = None
+
+
+@pytest.fixture
+def tmp_db_path(monkeypatch):
+    """Point the default jobs database at a temporary file with an empty cache."""
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    _close_shared_db()
+    monkeypatch.setattr(storage, "STORAGE_FILE", path)
+    storage._ai_usage_cache.clear()
+    yield path
+    storage._ai_usage_cache.clear()
+    _close_shared_db()
+    if os.path.exists(path):
+        os.unlink(path)
+
+
+class TestSharedDatabase:
+    """Tests for reusing one TinyDB instance across calls."""
+
+    def test_reuses_instance_for_same_path(self, tmp_db_path):
+        """Consecutive calls should share one open database."""
+        with storage._db_lock:
+            assert storage._db() is storage._db()
+
+    def test_mutating_result_does_not_leak(self, tmp_db_path):
+        """Records returned by one search must not alter later searches."""
+        storage.create_job("job_1", JobType.ENRICHMENT, "pl_1", "user")
+
+        storage.get_active_jobs("user")[0]["status"] = "mutated"
+
+        assert storage.get_job("job_1")["status"] == "pending"
+        assert storage.get_active_jobs("user")[0]["status"] == "pending"
+
+
+class TestCheckAndCreateJob:
+    """Tests for check_and_create_job()."""
+
+    def test_refuses_second_active_job_for_playlist(self, tmp_db_path):
+        """Only one pending/running job per playlist and owner."""
+        first = storage.check_and_create_job("pl_1", "user", "job_1", JobType.ENRICHMENT)
+        second = storage.check_and_create_job("pl_1", "user", "job_2", JobType.ENRICHMENT)
+
+        assert first["status"] == "pending"
+        assert second is None
+
+    def test_allows_new_job_after_previous_finished(self, tmp_db_path):
+        """A terminal job should not block a new one."""
+        storage.check_and_create_job("pl_1", "user", "job_1", JobType.ENRICHMENT)
+        storage.update_job("job_1", {"status": "completed"})
+
+        assert storage.check_and_create_job("pl_1", "user", "job_2", JobType.ENRICHMENT)
+
+
+class TestAiUsageCache:
+    """Tests for the get_ai_usage() cache."""
+
+    def test_cached_read_skips_database(self, tmp_db_path, monkeypatch):
+        """A fresh cache entry should be served without opening the database."""
+        storage.get_ai_usage("user")
+
+        def fail(db=None):
+            raise AssertionError("database opened")
+
+        monkeypatch.setattr(storage, "_db", fail)
+
+        assert storage.get_ai_usage("user")["input_tokens"] == 0
+
+    def test_update_refreshes_cached_totals(self, tmp_db_path):
+        """Reads after a write should see the new totals immediately."""
+        assert storage.get_ai_usage("user")["input_tokens"] == 0
+
+        storage.update_ai_usage("user", 100, 0, 0.5)
+
+        usage = storage.get_ai_usage("user")
+        assert usage["input_tokens"] == 100
+        assert usage["cost"] == pytest.approx(0.5)
+
+    def test_returns_copies(self, tmp_db_path):
+        """Mutating a returned record should not corrupt the cache."""
+        storage.get_ai_usage("user")["input_tokens"] = 999
+
+        assert storage.get_ai_usage("user")["input_tokens"] == 0
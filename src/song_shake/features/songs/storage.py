@@ -1,10 +1,39 @@
+import os
 import threading
 
+import orjson
 from tinydb import TinyDB, Query
+from tinydb.storages import JSONStorage
 from pathlib import Path
 
 STORAGE_FILE = "songs.db"
 
+
+class OrjsonStorage(JSONStorage):
+    """TinyDB JSONStorage that (de)serializes with orjson.
+
+    TinyDB rewrites the whole file on every write, so encoding speed
+    dominates save_track cost once the catalog grows.
+    """
+
+    def __init__(self, path: str, **kwargs):
+        kwargs.setdefault("encoding", "utf-8")
+        super().__init__(path, **kwargs)
+
+    def read(self):
+        self._handle.seek(0, os.SEEK_END)
+        if not self._handle.tell():
+            return None
+        self._handle.seek(0)
+        return orjson.loads(self._handle.read())
+
+    def write(self, data) -> None:
+        self._handle.seek(0)
+        self._handle.write(orjson.dumps(data, default=str).decode())
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self._handle.truncate()
+
 # Module-level lock protects all TinyDB operations against concurrent access
 # from multiple background threads (FastAPI BackgroundTasks uses a thread pool).
 _db_lock = threading.Lock()
@@ -19,7 +48,7 @@ def init_db(path: str = STORAGE_FILE) -> TinyDB:
     """Return a singleton TinyDB instance for the given path."""
     global _db_instance, _db_instance_path
     if _db_instance is None or _db_instance_path != path:
-        _db_instance = TinyDB(path)
+        _db_instance = TinyDB(path, storage=OrjsonStorage)
         _db_instance_path = path
     return _db_instance
 
@@ -67,6 +96,61 @@ def save_track(db: TinyDB, track_data: dict):
             # Fallback if no videoId (should rarely happen)
             _safe_write(songs_table, 'insert', track_data)
 
+def save_tracks(db: TinyDB, tracks: list[dict]):
+    """Save or update many tracks in the global catalog and link them to users.
+
+    Equivalent to calling save_track for each track, but TinyDB rewrites the
+    whole file on every write, so this issues at most three writes in total
+    (update existing songs, insert new songs, insert new links) instead of
+    up to two per track.
+    """
+    with _db_lock:
+        songs_table = db.table('songs')
+        user_songs_table = db.table('user_songs')
+        Song = Query()
+        UserSong = Query()
+
+        by_id: dict[str, dict] = {}
+        links: dict[tuple[str, str], None] = {}  # ordered set of (owner, videoId)
+        without_id: list[dict] = []
+        for track_data in tracks:
+            # Remove owner from global track_data to keep catalog generic
+            owner = track_data.pop('owner', 'local')
+            video_id = track_data.get('videoId')
+            if video_id:
+                by_id[video_id] = track_data  # last save of a videoId wins
+                links[(owner, video_id)] = None
+            else:
+                without_id.append(track_data)
+
+        if by_id:
+            existing_docs = songs_table.search(Song.videoId.one_of(set(by_id)))
+            if existing_docs:
+                def _apply(doc):
+                    doc.update(by_id[doc['videoId']])
+
+                _safe_write(
+                    songs_table, 'update', _apply,
+                    doc_ids=[doc.doc_id for doc in existing_docs],
+                )
+            existing_ids = {doc['videoId'] for doc in existing_docs}
+            new_songs = [t for vid, t in by_id.items() if vid not in existing_ids]
+            if new_songs or without_id:
+                _safe_write(songs_table, 'insert_multiple', new_songs + without_id)
+
+            linked = {
+                (link['owner'], link['videoId'])
+                for link in user_songs_table.search(UserSong.videoId.one_of(set(by_id)))
+            }
+            new_links = [
+                {'owner': owner, 'videoId': video_id}
+                for owner, video_id in links if (owner, video_id) not in linked
+            ]
+            if new_links:
+                _safe_write(user_songs_table, 'insert_multiple', new_links)
+        elif without_id:
+            _safe_write(songs_table, 'insert_multiple', without_id)
+
 def save_enrichment_history(playlist_id: str, owner: str, metadata: dict, db: TinyDB = None):
     """Save enrichment history for a playlist."""
     with _db_lock:
@@ -105,7 +189,7 @@ def wipe_db(path: str = STORAGE_FILE):
     """Wipe the database file."""
     with _db_lock:
         if Path(path).exists():
-            db = TinyDB(path)
+            db = TinyDB(path, storage=OrjsonStorage)
             db.truncate()
             db.close()
 
@@ -163,6 +247,21 @@ def get_track_by_id(db: TinyDB, video_id: str) -> dict:
         result = songs_table.search(Song.videoId == video_id)
         return result[0] if result else None
 
+def get_tracks_by_ids(db: TinyDB, video_ids: list[str]) -> dict:
+    """Return existing global-catalog tracks for many videoIds in one scan.
+
+    Returns a dict keyed by videoId; ids not in the catalog are omitted.
+    """
+    if not video_ids:
+        return {}
+    with _db_lock:
+        if db is None:
+            db = init_db()
+        songs_table = db.table('songs')
+        Song = Query()
+        wanted = set(video_ids)
+        return {s['videoId']: s for s in songs_table.search(Song.videoId.one_of(wanted))}
+
 def get_tags(db: TinyDB = None, owner: str = 'local') -> dict:
     """Get all unique moods and genres from the database, sorted by count."""
     with _db_lock:
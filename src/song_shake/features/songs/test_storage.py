@@ -150,6 +150,95 @@ class TestGetAllTracks:
         assert len(user2_tracks) == 1
 
 
+class TestOrjsonStorage:
+    """Tests for the orjson-backed TinyDB storage."""
+
+    def test_round_trip_preserves_unicode(self, tmp_db_path):
+        """Should read back exactly what was written, including non-ASCII."""
+        db = TinyDB(tmp_db_path, storage=storage.OrjsonStorage)
+        storage.save_track(
+            db,
+            {"videoId": "u1", "title": "Café — 夜に駆ける", "status": "success", "owner": "u"},
+        )
+        db.close()
+
+        reopened = TinyDB(tmp_db_path, storage=storage.OrjsonStorage)
+        assert storage.get_track_by_id(reopened, "u1")["title"] == "Café — 夜に駆ける"
+        reopened.close()
+
+    def test_reads_files_written_by_stdlib_json(self, tmp_db_path):
+        """Should open existing databases written by TinyDB's default storage."""
+        legacy = TinyDB(tmp_db_path)
+        legacy.table("songs").insert({"videoId": "old", "title": "Ol\u00e9"})
+        legacy.close()
+
+        db = TinyDB(tmp_db_path, storage=storage.OrjsonStorage)
+        assert storage.get_track_by_id(db, "old")["title"] == "Ol\u00e9"
+        db.close()
+
+
+class TestGetTracksByIds:
+    """Tests for get_tracks_by_ids()."""
+
+    def test_returns_only_existing_tracks(self, tmp_db):
+        """Should return a dict of catalog tracks keyed by videoId."""
+        for vid in ["vid1", "vid2"]:
+            storage.save_track(
+                tmp_db,
+                {"videoId": vid, "title": vid, "status": "success", "owner": "user1"},
+            )
+
+        found = storage.get_tracks_by_ids(tmp_db, ["vid1", "missing", "vid2"])
+
+        assert set(found) == {"vid1", "vid2"}
+        assert found["vid1"]["title"] == "vid1"
+
+    def test_empty_input(self, tmp_db):
+        """Should return an empty dict without scanning for no ids."""
+        assert storage.get_tracks_by_ids(tmp_db, []) == {}
+
+
+class TestSaveTracks:
+    """Tests for save_tracks()."""
+
+    def test_matches_per_track_saves(self, tmp_db):
+        """Should upsert catalog songs and link owners like save_track."""
+        storage.save_track(
+            tmp_db, {"videoId": "old", "title": "Old", "status": "error", "owner": "user1"}
+        )
+
+        storage.save_tracks(
+            tmp_db,
+            [
+                {"videoId": "old", "title": "Old v2", "status": "success", "owner": "user1"},
+                {"videoId": "new", "title": "New", "status": "success", "owner": "user1"},
+                {"videoId": "new", "title": "New", "status": "success", "owner": "user2"},
+            ],
+        )
+
+        songs = {s["videoId"]: s for s in tmp_db.table("songs").all()}
+        assert set(songs) == {"old", "new"}
+        assert songs["old"]["title"] == "Old v2"
+        assert "owner" not in songs["new"]
+        links = {(l["owner"], l["videoId"]) for l in tmp_db.table("user_songs").all()}
+        assert links == {("user1", "old"), ("user1", "new"), ("user2", "new")}
+        assert len(tmp_db.table("user_songs")) == 3
+
+    def test_writes_constant_number_of_times(self, tmp_db):
+        """Should not rewrite the database once per track."""
+        tracks = [
+            {"videoId": f"v{i}", "title": f"S{i}", "owner": "user1"} for i in range(20)
+        ]
+        writes = []
+        original_write = tmp_db.storage.write
+        tmp_db.storage.write = lambda data: (writes.append(1), original_write(data))
+
+        storage.save_tracks(tmp_db, tracks)
+
+        assert len(writes) <= 3
+        assert len(storage.get_all_tracks(tmp_db, "user1")) == 20
+
+
 class TestGetTags:
     """Tests for get_tags()."""
 
@@ -87,6 +87,73 @@ class FirestoreSongsAdapter:
 
         _invalidate_tracks_cache(owner)
 
+    def save_tracks_batch(self, tracks: list[dict]) -> None:
+        """Save many tracks with batched writes (Firestore limit: 500 ops)."""
+        from google.cloud.firestore_v1 import Increment
+
+        tracks = [t for t in tracks if t.get("videoId")]
+        if not tracks:
+            return
+
+        # Read all existing tracks for tag-count diffs in one round-trip
+        refs = {
+            t["videoId"]: self._db.collection("tracks").document(t["videoId"])
+            for t in tracks
+        }
+        old_by_id = {
+            snap.id: snap.to_dict()
+            for snap in self._db.get_all(list(refs.values()))
+            if snap.exists
+        }
+
+        batch = self._db.batch()
+        batch_count = 0
+        owner_deltas: dict[str, Counter] = {}
+        for track_data in tracks:
+            video_id = track_data["videoId"]
+            owner = track_data.get("owner", "local")
+
+            if batch_count + 2 > 500:
+                batch.commit()
+                batch = self._db.batch()
+                batch_count = 0
+
+            global_data = {k: v for k, v in track_data.items() if k != "owner"}
+            batch.set(refs[video_id], global_data, merge=True)
+            batch.set(
+                self._db.collection("track_owners").document(f"{owner}_{video_id}"),
+                {"owner": owner, "videoId": video_id},
+            )
+            batch_count += 2
+
+            old_data = old_by_id.get(video_id)
+            owner_deltas.setdefault(owner, Counter()).update(
+                self._tag_count_delta(track_data, old_data)
+            )
+            # A repeated videoId later in the batch diffs against this save
+            old_by_id[video_id] = {**(old_data or {}), **global_data}
+
+        for owner, delta in owner_deltas.items():
+            increments = {k: Increment(v) for k, v in delta.items() if v}
+            if not increments:
+                continue
+            if batch_count + 1 > 500:
+                batch.commit()
+                batch = self._db.batch()
+                batch_count = 0
+            batch.set(
+                self._db.collection("tag_counts").document(owner),
+                increments,
+                merge=True,
+            )
+            batch_count += 1
+
+        if batch_count > 0:
+            batch.commit()
+
+        for owner in owner_deltas:
+            _invalidate_tracks_cache(owner)
+
     def get_all_tracks(self, owner: str) -> list[dict]:
         # Check TTL cache first
         now = _time.monotonic()
@@ -128,6 +195,21 @@ class FirestoreSongsAdapter:
         doc = self._db.collection("tracks").document(video_id).get()
         return doc.to_dict() if doc.exists else None
 
+    def get_tracks_by_ids(self, video_ids: list[str]) -> dict[str, dict]:
+        """Fetch many global-catalog tracks by document id in one round-trip."""
+        refs = [
+            self._db.collection("tracks").document(video_id)
+            for video_id in dict.fromkeys(video_ids)
+            if video_id
+        ]
+        if not refs:
+            return {}
+        return {
+            snap.id: snap.to_dict()
+            for snap in self._db.get_all(refs)
+            if snap.exists
+        }
+
     def get_tags(self, owner: str) -> list[dict]:
         tracks = self.get_all_tracks(owner)
         tag_counts: dict[tuple[str, str], int] = {}
@@ -344,12 +426,10 @@ class FirestoreSongsAdapter:
             counts[f"instruments.{i}"] += 1
         return counts
 
-    def _update_tag_counts_on_save(
-        self, owner: str, new_track: dict, old_track: dict | None
-    ) -> None:
-        """Incrementally update tag_counts/{owner} after saving a track."""
-        from google.cloud.firestore_v1 import Increment
-
+    def _tag_count_delta(
+        self, new_track: dict, old_track: dict | None
+    ) -> dict[str, int]:
+        """Return the tag_counts change caused by replacing old_track with new_track."""
         new_tags = self._extract_tags(new_track)
         old_tags = self._extract_tags(old_track) if old_track else Counter()
 
@@ -362,11 +442,22 @@ class FirestoreSongsAdapter:
                 delta[key] = diff
 
         if not delta:
-            return
+            return delta
 
         # Also increment total if this is a new track (old_track is None)
         if old_track is None:
             delta["total"] = 1
+        return delta
+
+    def _update_tag_counts_on_save(
+        self, owner: str, new_track: dict, old_track: dict | None
+    ) -> None:
+        """Incrementally update tag_counts/{owner} after saving a track."""
+        from google.cloud.firestore_v1 import Increment
+
+        delta = self._tag_count_delta(new_track, old_track)
+        if not delta:
+            return
 
         doc_ref = self._db.collection("tag_counts").document(owner)
         doc_ref.set(
@@ -20,6 +20,10 @@ def configure_logging() -> None:
     log_level = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
 
     shared_processors: list[structlog.types.Processor] = [
+        # Drop events below LOG_LEVEL before any other processor runs, so
+        # disabled debug calls cost one level check instead of a full
+        # timestamp/render pass that stdlib would then discard.
+        structlog.stdlib.filter_by_level,
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.processors.TimeStamper(fmt="iso"),
@@ -15,10 +15,14 @@ class StoragePort(Protocol):
 
     def save_track(self, track_data: dict) -> None: ...
 
+    def save_tracks_batch(self, tracks: list[dict]) -> None: ...
+
     def get_all_tracks(self, owner: str) -> list[dict]: ...
 
     def get_track_by_id(self, video_id: str) -> dict | None: ...
 
+    def get_tracks_by_ids(self, video_ids: list[str]) -> dict[str, dict]: ...
+
     def get_tags(self, owner: str) -> list[dict]: ...
 
     def get_failed_tracks(self, owner: str) -> list[dict]: ...
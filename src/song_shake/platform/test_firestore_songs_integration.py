@@ -40,6 +40,26 @@ class TestFirestoreSongsAdapter:
 
         assert songs_adapter.get_track_by_id("nonexistent") is None
 
+    def test_get_tracks_by_ids(self, songs_adapter):
+        """Should bulk-fetch existing tracks keyed by videoId."""
+        songs_adapter.save_track({"videoId": "bulk1", "title": "B1", "owner": "o1", "status": "success"})
+        songs_adapter.save_track({"videoId": "bulk2", "title": "B2", "owner": "o1", "status": "success"})
+
+        found = songs_adapter.get_tracks_by_ids(["bulk1", "bulk2", "nonexistent"])
+        assert set(found) == {"bulk1", "bulk2"}
+        assert found["bulk2"]["title"] == "B2"
+
+    def test_save_tracks_batch(self, songs_adapter):
+        """Should save and link many tracks with batched writes."""
+        songs_adapter.save_tracks_batch([
+            {"videoId": "batch1", "title": "B1", "owner": "o1", "status": "success", "genres": ["Rock"]},
+            {"videoId": "batch2", "title": "B2", "owner": "o1", "status": "error"},
+        ])
+
+        tracks = songs_adapter.get_all_tracks("o1")
+        assert {t["videoId"] for t in tracks} == {"batch1", "batch2"}
+        assert songs_adapter.get_tag_counts("o1")["genres.Rock"] == 1
+
     def test_tracks_isolated_by_owner(self, songs_adapter):
         """Different owners should see only their own tracks."""
         songs_adapter.save_track({"videoId": "v1", "title": "T1", "owner": "alice", "status": "success"})